@@ -1,6 +1,29 @@
+import hashlib
+import os
+
 import google.generativeai as genai
 import streamlit as st
 
+PREFERRED_MODELS = ["gemini-1.5-flash", "gemini-flash-latest", "gemini-1.5-pro", "gemini-pro"]
+
+# Resolved model name per API key hash. Only successes are stored, so a key with
+# no usable model (or a failed lookup) is retried on the next request.
+_MODEL_CACHE = {}
+_MODEL_CACHE_SIZE = 8
+
+def _resolve_model(api_key_hash):
+    # list_models() is a blocking network call, so do it once per key.
+    # genai must already be configured with the key that api_key_hash identifies.
+    if api_key_hash in _MODEL_CACHE: return _MODEL_CACHE[api_key_hash]
+    if os.environ.get("GEMINI_SKIP_DISCOVERY") == "1": return PREFERRED_MODELS[0]
+    all_models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
+    available_names = [m.replace("models/", "") for m in all_models]
+    model = next((m for m in PREFERRED_MODELS if m in available_names), available_names[0] if available_names else None)
+    if model is not None:
+        if len(_MODEL_CACHE) >= _MODEL_CACHE_SIZE: _MODEL_CACHE.pop(next(iter(_MODEL_CACHE)))
+        _MODEL_CACHE[api_key_hash] = model
+    return model
+
 class GeminiAssistant:
     def __init__(self, api_key):
         self.model = None
@@ -12,11 +35,7 @@ class GeminiAssistant:
 
         try:
             genai.configure(api_key=api_key)
-            all_models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
-            available_names = [m.replace("models/", "") for m in all_models]
-            
-            preferred_order = ["gemini-1.5-flash", "gemini-flash-latest", "gemini-1.5-pro", "gemini-pro"]
-            target_model = next((m for m in preferred_order if m in available_names), available_names[0] if available_names else None)
+            target_model = _resolve_model(hashlib.sha256(api_key.encode()).hexdigest())
             
             if target_model:
                 self.model = genai.GenerativeModel(target_model)
@@ -27,14 +46,16 @@ class GeminiAssistant:
             self.model_available = False
 
     def generate_response(self, user_message, context_str):
-        if not self.model_available: return "AI is not available."
+        # Generator: yields text chunks as they stream in (render with st.write_stream)
+        if not self.model_available: yield "AI is not available."; return
         prompt = (
             "You are an expert chemical reaction engineering assistant.\n"
             f"Simulation context: {context_str}\n\n"
             f"User request: {user_message}"
         )
         try:
-            return self.model.generate_content(prompt).text
+            for chunk in self.model.generate_content(prompt, stream=True):
+                yield chunk.text
         except Exception as e:
-            if "429" in str(e): return "⚠️ Quota Limit Exceeded. Please wait 30 seconds."
-            return f"Error: {e}"
\ No newline at end of file
+            if "429" in str(e): yield "⚠️ Quota Limit Exceeded. Please wait 30 seconds."; return
+            yield f"Error: {e}"
@@ -11,6 +11,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import time
+import os
 
 # --- LOCAL IMPORTS ---
 from reactor_model import ReactorConfig, MethaneDecompositionReactor, MW_C, MW_H2
@@ -22,6 +23,7 @@ from core.optimizer import (
     create_objective_function,
     get_base_config_from_session
 )
+from core.sensitivity_morris import MorrisAnalyzer
 from core.transient_model import (
     DeactivationParams,
     DeactivationModel,
@@ -38,6 +40,7 @@ from core.experimental_data import (
 )
 from utils.plotting import (
     create_convergence_plot,
+    create_parameter_importance_plot,
     create_trials_table_data,
     create_summary_stats
 )
@@ -71,6 +74,10 @@ if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 if 'optimization_result' not in st.session_state:
     st.session_state.optimization_result = None
+if 'sensitivity_result' not in st.session_state:
+    st.session_state.sensitivity_result = None
+if 'optimizers' not in st.session_state:
+    st.session_state.optimizers = {}
 if 'validation_results' not in st.session_state:
     st.session_state.validation_results = {}
 if 'fitted_kd' not in st.session_state:
@@ -109,7 +116,7 @@ def run_simulation():
         )
         
         reactor = MethaneDecompositionReactor(config, isothermal=st.session_state.iso_check)
-        st.session_state.simulation_data = reactor.solve()
+        st.session_state.simulation_data = reactor.solve_profile()
         st.session_state.config_data = config
         
     except Exception as e:
@@ -132,7 +139,11 @@ def handle_ai_request(prompt_text):
 
     if GEMINI_API_KEY:
         ai = GeminiAssistant(GEMINI_API_KEY)
-        response = ai.generate_response(prompt_text, context_str)
+        # Stream the reply as it arrives; the full text then lives in chat history
+        stream_placeholder = st.empty()
+        with stream_placeholder.container():
+            response = st.chat_message("assistant").write_stream(ai.generate_response(prompt_text, context_str))
+        stream_placeholder.empty()
     else:
         response = "⚠️ AI not configured. Add GEMINI_API_KEY to secrets."
     
@@ -537,6 +548,14 @@ with tab_opt:
         st.info(f"**{template['description']}**")
         
         n_iterations = st.slider("Iterations", 10, 100, template['suggested_iterations'], key="opt_iter")
+        n_workers = st.slider(
+            "Parallel Workers", 1, os.cpu_count() or 1, 1, key="opt_workers",
+            help="Run several simulations at once (parallel Thompson sampling)"
+        )
+        warm_start = st.checkbox(
+            "Continue from previous runs", value=False, key="opt_warm_start",
+            help="Seed the search with trials from earlier runs of this goal (same reactor settings)"
+        )
     
     with col2:
         st.markdown("#### Variable Bounds")
@@ -554,37 +573,83 @@ with tab_opt:
         variable_names = list(variable_bounds.keys())
         bounds = list(variable_bounds.values())
         
-        config = OptimizationConfig(
-            variable_names=variable_names,
-            bounds=bounds,
-            n_iterations=n_iterations,
-            n_initial_points=min(5, n_iterations // 3),
-            maximize=(template['objective']['direction'] == 'maximize')
-        )
+        # Constraint violations score as the worst value: 0 for maximized outputs,
+        # the upper bound when minimizing one of the search variables
+        target = template['objective']['target']
+        if template['objective']['direction'] == 'minimize' and target in variable_bounds:
+            infeasible_value = variable_bounds[target][1]
+        else:
+            infeasible_value = 0.0
         
         objective_fn = create_objective_function(
             MethaneDecompositionReactor,
             base_config,
             variable_names,
-            template['objective']['target']
+            target,
+            solver_tol=template.get('solver_tol', 'refinement'),
+            constraints=template.get('constraints', []),
+            infeasible_value=infeasible_value
         )
         
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        def update_callback(iteration, params, value):
-            progress_bar.progress(iteration / n_iterations)
-            status_text.write(f"🔄 Iteration {iteration}/{n_iterations} | Value: {value:.4f}")
-        
-        optimizer = BayesianOptimizer(config)
-        
-        with st.spinner("Running optimization..."):
-            result = optimizer.optimize(objective_fn, callback=update_callback)
-        
-        st.session_state.optimization_result = result
-        progress_bar.progress(1.0)
-        status_text.write("✅ Optimization Complete!")
-        st.success(f"**Best Value: {result.best_value:.4f}**")
+        if template.get('method') == 'morris':
+            # Screening: Iterations budget -> r trajectories of (k + 1) runs each
+            analyzer = MorrisAnalyzer(
+                variable_names,
+                bounds,
+                n_trajectories=max(2, n_iterations // (len(variable_names) + 1))
+            )
+            
+            def morris_callback(iteration, total, params, value):
+                progress_bar.progress(iteration / total)
+                status_text.write(f"🔄 Run {iteration}/{total} | Value: {value:.4f}")
+            
+            with st.spinner("Running sensitivity screening..."):
+                importance = analyzer.analyze(objective_fn, callback=morris_callback, n_workers=n_workers)
+            
+            st.session_state.sensitivity_result = {
+                'importance': importance,
+                'mu_star': analyzer.mu_star,
+                'sigma': analyzer.sigma,
+            }
+            st.session_state.optimization_result = None
+            progress_bar.progress(1.0)
+            status_text.write("✅ Sensitivity Analysis Complete!")
+        else:
+            config = OptimizationConfig(
+                variable_names=variable_names,
+                bounds=bounds,
+                n_iterations=n_iterations,
+                n_initial_points=min(5, n_iterations // 3),
+                maximize=(template['objective']['direction'] == 'maximize'),
+                n_workers=n_workers,
+                warm_start=warm_start
+            )
+            
+            def update_callback(iteration, params, value):
+                progress_bar.progress(iteration / n_iterations)
+                status_text.write(f"🔄 Iteration {iteration}/{n_iterations} | Value: {value:.4f}")
+            
+            # One optimizer per goal keeps earlier trials for warm starts;
+            # they are only valid while the reactor settings are unchanged
+            saved = st.session_state.optimizers.get(selected_template_key)
+            if saved is not None and saved[0] == base_config:
+                optimizer = saved[1]
+                optimizer.config = config
+            else:
+                optimizer = BayesianOptimizer(config)
+                st.session_state.optimizers[selected_template_key] = (base_config, optimizer)
+            
+            with st.spinner("Running optimization..."):
+                result = optimizer.optimize(objective_fn, callback=update_callback)
+            
+            st.session_state.optimization_result = result
+            st.session_state.sensitivity_result = None
+            progress_bar.progress(1.0)
+            status_text.write("✅ Optimization Complete!")
+            st.success(f"**Best Value: {result.best_value:.4f}**")
     
     if st.session_state.optimization_result:
         result = st.session_state.optimization_result
@@ -603,6 +668,26 @@ with tab_opt:
             fig = create_convergence_plot(result.convergence, result.best_so_far)
             st.pyplot(fig)
             plt.close(fig)
+    
+    if st.session_state.sensitivity_result:
+        sens = st.session_state.sensitivity_result
+        
+        st.markdown("---")
+        st.markdown("### 🎓 Parameter Importance")
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            fig = create_parameter_importance_plot(sens['importance'])
+            st.pyplot(fig)
+            plt.close(fig)
+        
+        with col2:
+            st.markdown("#### Morris Indices")
+            st.dataframe(pd.DataFrame({
+                'μ*': sens['mu_star'],
+                'σ': sens['sigma'],
+            }))
+            st.caption("High σ relative to μ* indicates non-linear effects or interactions.")
 
 # ============================================================================
 # TAB 4: AI ASSISTANT
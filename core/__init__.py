@@ -13,6 +13,7 @@ from .templates import (
 )
 
 from .optimizer import (
+    TrialHistory,
     OptimizationResult,
     OptimizationConfig,
     BayesianOptimizer,
@@ -21,6 +22,8 @@ from .optimizer import (
     get_base_config_from_session
 )
 
+from .sensitivity_morris import MorrisAnalyzer
+
 from .transient_model import (
     DeactivationParams,
     DeactivationModel,
@@ -36,6 +39,8 @@ from .experimental_data import (
     TOS_MINUTES,
     ExperimentalConditions,
     DEFAULT_CONDITIONS,
+    CONDITIONS_DTYPE,
+    DEFAULT_CONDITIONS_ARR,
     get_experimental_data,
     get_available_temperatures,
     get_initial_values,
@@ -51,12 +56,15 @@ __all__ = [
     'get_variable_bounds',
     'get_variable_names',
     # Optimizer
+    'TrialHistory',
     'OptimizationResult',
     'OptimizationConfig',
     'BayesianOptimizer',
     'SensitivityAnalyzer',
     'create_objective_function',
     'get_base_config_from_session',
+    # Sensitivity
+    'MorrisAnalyzer',
     # Transient model
     'DeactivationParams',
     'DeactivationModel',
@@ -70,6 +78,8 @@ __all__ = [
     'TOS_MINUTES',
     'ExperimentalConditions',
     'DEFAULT_CONDITIONS',
+    'CONDITIONS_DTYPE',
+    'DEFAULT_CONDITIONS_ARR',
     'get_experimental_data',
     'get_available_temperatures',
     'get_initial_values',
@@ -7,8 +7,9 @@ Methane decomposition: CH4 → C + 2H2
 """
 
 import numpy as np
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from dataclasses import astuple, dataclass, fields
+from typing import Dict, List, Optional, Union
 
 # ============================================================================
 # EXPERIMENTAL DATA FROM LITERATURE
@@ -17,27 +18,73 @@ from typing import Dict, List, Optional
 # Time on Stream (TOS) in minutes
 TOS_MINUTES = np.array([0, 30, 60, 90, 120, 150, 180, 210])
 
-# Experimental data at different temperatures
-# Format: {"temperature_C": {"H2_percent": [...], "CH4_percent": [...]}}
-
+# Temperatures with experimental data [°C]
+TEMPS = np.array([770, 800, 830])
+
+# Row indices along axis 1 of _DATA
+_TOS, _H2, _CH4 = 0, 1, 2
+
+# Experimental data as one contiguous array of shape (n_temps, 3, n_TOS)
+# Axis 0 follows TEMPS, axis 1 is (TOS_min, H2_percent, CH4_percent)
+_DATA = np.array([
+    [   # 770 °C
+        TOS_MINUTES,
+        [11.41, 20.28, 16.1, 14.08, 12.81, 11.82, 11.12, 10.33],
+        [24.87, 79.71, 83.89, 85.91, 87.18, 88.17, 88.87, 89.66],
+    ],
+    [   # 800 °C
+        TOS_MINUTES,
+        [24.13, 24.5, 20.51, 17.8, 16.74, 15.51, 14.44, 13.43],
+        [65.0, 75.49, 79.48, 82.19, 83.25, 84.48, 85.55, 86.56],
+    ],
+    [   # 830 °C
+        TOS_MINUTES,
+        [40.69, 31.68, 25.23, 23.9, 22.29, 20.36, 19.8, 18.79],
+        [44.64, 68.31, 74.76, 76.09, 77.7, 79.63, 80.19, 81.2],
+    ],
+], dtype=np.float64)
+
+# Dict API kept as a thin shim over _DATA (composition arrays are views)
+# Format: {temperature_C: {"TOS_min": [...], "H2_percent": [...], "CH4_percent": [...]}}
 EXPERIMENTAL_DATA = {
-    770: {
-        "TOS_min": TOS_MINUTES,
-        "H2_percent": np.array([11.41, 20.28, 16.1, 14.08, 12.81, 11.82, 11.12, 10.33]),
-        "CH4_percent": np.array([24.87, 79.71, 83.89, 85.91, 87.18, 88.17, 88.87, 89.66]),
-    },
-    800: {
-        "TOS_min": TOS_MINUTES,
-        "H2_percent": np.array([24.13, 24.5, 20.51, 17.8, 16.74, 15.51, 14.44, 13.43]),
-        "CH4_percent": np.array([65.0, 75.49, 79.48, 82.19, 83.25, 84.48, 85.55, 86.56]),
-    },
-    830: {
+    int(temp): {
         "TOS_min": TOS_MINUTES,
-        "H2_percent": np.array([40.69, 31.68, 25.23, 23.9, 22.29, 20.36, 19.8, 18.79]),
-        "CH4_percent": np.array([44.64, 68.31, 74.76, 76.09, 77.7, 79.63, 80.19, 81.2]),
-    },
+        "H2_percent": _DATA[i, _H2],
+        "CH4_percent": _DATA[i, _CH4],
+    }
+    for i, temp in enumerate(TEMPS)
 }
 
+# H2 composition as (n_temperatures, n_TOS) matrix, rows ordered like TEMPS
+H2_MATRIX = _DATA[:, _H2]
+
+# ============================================================================
+# INTERPOLATION TABLES
+# ============================================================================
+
+def _build_interp_table(block: np.ndarray) -> tuple:
+    """
+    Precompute one temperature's interpolation table.
+    
+    Breakpoints and piecewise-linear (slope, intercept) segments are stored as
+    plain tuples so a scalar lookup is bisect + float arithmetic with no NumPy
+    dispatch; the raw columns are kept for np.interp on array inputs.
+    """
+    tos = block[_TOS]
+    
+    def segments(values):
+        slopes = np.diff(values) / np.diff(tos)
+        intercepts = values[:-1] - slopes * tos[:-1]
+        return tuple(slopes.tolist()), tuple(intercepts.tolist())
+    
+    return (tuple(tos.tolist()), *segments(block[_H2]), *segments(block[_CH4]),
+            tos, block[_H2], block[_CH4])
+
+
+# {temperature_C: (TOS, H2 slopes, H2 intercepts, CH4 slopes, CH4 intercepts,
+#                  TOS column, H2 column, CH4 column)}
+_INTERP_TABLES = {int(temp): _build_interp_table(_DATA[i]) for i, temp in enumerate(TEMPS)}
+
 # ============================================================================
 # EXPERIMENTAL CONDITIONS (Estimated/Default if not provided)
 # ============================================================================
@@ -71,10 +118,25 @@ class ExperimentalConditions:
     activation_energy_kJ_mol: float = 100.0  # kJ/mol
     beta: float = 0.0
     heat_of_reaction_kJ_mol: float = 74.87   # kJ/mol (endothermic)
+    
+    def to_array(self) -> np.ndarray:
+        """Pack into a length-1 structured array (CONDITIONS_DTYPE)"""
+        return np.array([astuple(self)], dtype=CONDITIONS_DTYPE)
+    
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "ExperimentalConditions":
+        """Unpack a CONDITIONS_DTYPE record (or length-1 array)"""
+        record = np.asarray(arr, dtype=CONDITIONS_DTYPE).reshape(-1)[0]
+        return cls(*(float(value) for value in record.tolist()))
+
 
+# Structured dtype mirroring ExperimentalConditions: one contiguous float64
+# record that can be passed to vectorized/Numba code without attribute lookups
+CONDITIONS_DTYPE = np.dtype([(f.name, np.float64) for f in fields(ExperimentalConditions)])
 
 # Default experimental conditions
 DEFAULT_CONDITIONS = ExperimentalConditions()
+DEFAULT_CONDITIONS_ARR = DEFAULT_CONDITIONS.to_array()
 
 
 # ============================================================================
@@ -97,7 +159,7 @@ def get_experimental_data(temperature_C: int) -> Optional[Dict]:
 
 def get_available_temperatures() -> List[int]:
     """Get list of temperatures with experimental data"""
-    return list(EXPERIMENTAL_DATA.keys())
+    return TEMPS.tolist()
 
 
 def get_initial_values(temperature_C: int) -> Optional[Dict]:
@@ -122,106 +184,125 @@ def get_initial_values(temperature_C: int) -> Optional[Dict]:
 
 def get_all_initial_values() -> Dict[int, Dict]:
     """Get initial values for all temperatures"""
-    result = {}
-    for temp in get_available_temperatures():
-        result[temp] = get_initial_values(temp)
-    return result
+    initial = _DATA[:, _H2:_CH4 + 1, 0]
+    return {
+        int(temp): {"H2_percent": float(h2), "CH4_percent": float(ch4)}
+        for temp, (h2, ch4) in zip(TEMPS, initial)
+    }
 
 
-def interpolate_experimental(temperature_C: int, time_min: float) -> Optional[Dict]:
+def interpolate_experimental(temperature_C: int, time_min: Union[float, np.ndarray]) -> Optional[Dict]:
     """
     Interpolate experimental data at a specific time.
     
     Args:
         temperature_C: Temperature in Celsius
-        time_min: Time on stream in minutes
+        time_min: Time on stream in minutes (scalar or array)
     
     Returns:
         Dictionary with interpolated H2_percent and CH4_percent
     """
-    data = get_experimental_data(temperature_C)
-    if data is None:
+    table = _INTERP_TABLES.get(temperature_C)
+    if table is None:
         return None
     
-    H2_interp = np.interp(time_min, data["TOS_min"], data["H2_percent"])
-    CH4_interp = np.interp(time_min, data["TOS_min"], data["CH4_percent"])
+    tos, H2_slopes, H2_intercepts, CH4_slopes, CH4_intercepts, tos_col, H2_col, CH4_col = table
+    
+    if not isinstance(time_min, (int, float)):
+        return {
+            "H2_percent": np.interp(time_min, tos_col, H2_col),
+            "CH4_percent": np.interp(time_min, tos_col, CH4_col),
+        }
+    
+    # Clamp to measured range (same behavior as np.interp)
+    t = min(max(time_min, tos[0]), tos[-1])
+    idx = min(bisect_right(tos, t) - 1, len(tos) - 2)
     
     return {
-        "H2_percent": H2_interp,
-        "CH4_percent": CH4_interp,
+        "H2_percent": H2_intercepts[idx] + H2_slopes[idx] * t,
+        "CH4_percent": CH4_intercepts[idx] + CH4_slopes[idx] * t,
     }
 
 
-def calculate_conversion_from_composition(CH4_in_percent: float, CH4_out_percent: float) -> float:
+def calculate_conversion_from_composition(
+    CH4_in_percent: Union[float, np.ndarray],
+    CH4_out_percent: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate CH4 conversion from inlet and outlet compositions.
     
     Note: This is approximate - actual conversion depends on molar flow changes.
     For dilute systems, this gives reasonable estimate.
+    
+    Accepts scalars or arrays (broadcast elementwise); scalar inputs return a float.
     """
-    if CH4_in_percent <= 0:
-        return 0.0
+    CH4_in = np.asarray(CH4_in_percent, dtype=float)
+    CH4_out = np.asarray(CH4_out_percent, dtype=float)
     
     # Approximate conversion (valid for dilute/constant total moles)
-    conversion = (CH4_in_percent - CH4_out_percent) / CH4_in_percent * 100
-    return max(0.0, min(100.0, conversion))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        conversion = (CH4_in - CH4_out) / CH4_in * 100
+    conversion = np.where(CH4_in > 0, np.clip(conversion, 0.0, 100.0), 0.0)
+    
+    return float(conversion) if conversion.ndim == 0 else conversion
 
 
 def get_experimental_summary() -> str:
     """Get a text summary of experimental data"""
-    summary = "=" * 60 + "\n"
-    summary += "EXPERIMENTAL DATA SUMMARY\n"
-    summary += "=" * 60 + "\n\n"
-    
-    summary += "Reaction: CH4 → C + 2H2\n"
-    summary += f"Time on Stream: {TOS_MINUTES[0]} to {TOS_MINUTES[-1]} minutes\n"
-    summary += f"Temperatures: {get_available_temperatures()} °C\n\n"
-    
-    summary += "-" * 60 + "\n"
-    summary += f"{'Temp (°C)':<12}{'H2% (t=0)':<15}{'H2% (t=210)':<15}{'Decay %':<15}\n"
-    summary += "-" * 60 + "\n"
+    H2_initial = H2_MATRIX[:, 0]
+    H2_final = H2_MATRIX[:, -1]
+    decay = (H2_initial - H2_final) / H2_initial * 100
     
-    for temp in get_available_temperatures():
-        data = get_experimental_data(temp)
-        H2_initial = data["H2_percent"][0]
-        H2_final = data["H2_percent"][-1]
-        decay = (H2_initial - H2_final) / H2_initial * 100
-        summary += f"{temp:<12}{H2_initial:<15.2f}{H2_final:<15.2f}{decay:<15.1f}\n"
+    rows = [
+        f"{temp:<12}{h2_0:<15.2f}{h2_end:<15.2f}{pct:<15.1f}"
+        for temp, h2_0, h2_end, pct in zip(get_available_temperatures(), H2_initial, H2_final, decay)
+    ]
     
-    summary += "-" * 60 + "\n"
+    lines = [
+        "=" * 60,
+        "EXPERIMENTAL DATA SUMMARY",
+        "=" * 60,
+        "",
+        "Reaction: CH4 → C + 2H2",
+        f"Time on Stream: {TOS_MINUTES[0]} to {TOS_MINUTES[-1]} minutes",
+        f"Temperatures: {get_available_temperatures()} °C",
+        "",
+        "-" * 60,
+        f"{'Temp (°C)':<12}{'H2% (t=0)':<15}{'H2% (t=210)':<15}{'Decay %':<15}",
+        "-" * 60,
+        *rows,
+        "-" * 60,
+    ]
     
-    return summary
+    return "\n".join(lines) + "\n"
 
 
 # ============================================================================
 # DATA VALIDATION
 # ============================================================================
 
-def validate_experimental_data() -> bool:
-    """Check that experimental data is consistent"""
-    for temp, data in EXPERIMENTAL_DATA.items():
-        # Check array lengths match
-        if len(data["TOS_min"]) != len(data["H2_percent"]):
-            print(f"Error: TOS and H2 length mismatch at {temp}°C")
-            return False
-        if len(data["TOS_min"]) != len(data["CH4_percent"]):
-            print(f"Error: TOS and CH4 length mismatch at {temp}°C")
-            return False
-        
-        # Check compositions are reasonable (0-100%)
-        if np.any(data["H2_percent"] < 0) or np.any(data["H2_percent"] > 100):
-            print(f"Error: H2% out of range at {temp}°C")
-            return False
-        if np.any(data["CH4_percent"] < 0) or np.any(data["CH4_percent"] > 100):
-            print(f"Error: CH4% out of range at {temp}°C")
-            return False
-    
-    return True
+def validate_experimental_data() -> None:
+    """
+    Check that experimental data is consistent.
+    
+    Raises:
+        ValueError: If TOS and composition arrays mismatch or any
+                    composition lies outside 0-100%
+    """
+    # Check array lengths and TOS grid match
+    if _DATA.shape[2] != len(TOS_MINUTES) or not (_DATA[:, _TOS] == TOS_MINUTES).all():
+        raise ValueError("Experimental data validation failed: TOS and composition arrays mismatch")
+    
+    # Check compositions are reasonable (0-100%), all temperatures in one pass
+    compositions = _DATA[:, _H2:, :]
+    in_range = (compositions >= 0) & (compositions <= 100)
+    if not in_range.all():
+        bad_temps = TEMPS[~in_range.all(axis=(1, 2))].tolist()
+        raise ValueError(f"Experimental data validation failed: composition out of range at {bad_temps}°C")
 
 
 # Run validation on import
-if not validate_experimental_data():
-    raise ValueError("Experimental data validation failed!")
+validate_experimental_data()
 
 
 # ============================================================================
@@ -0,0 +1,177 @@
+"""
+Anukaran AI - JAX Gaussian Process
+==================================
+JIT-compiled Gaussian Process surrogate for Bayesian optimization.
+Kernel matrix, Cholesky and likelihood gradients compile to fused XLA kernels.
+Requires jax - only imported when the 'jax' GP backend is selected.
+"""
+
+import numpy as np
+import jax
+import jax.numpy as jnp
+from jax.scipy.linalg import cho_solve
+from jax.scipy.optimize import minimize as jax_minimize
+from jax.scipy.stats import norm
+from scipy.optimize import minimize
+
+# GP fits need double precision for a stable Cholesky
+jax.config.update("jax_enable_x64", True)
+
+JITTER = 1e-8
+
+
+# ============================================================================
+# KERNEL AND LIKELIHOOD
+# ============================================================================
+
+@jax.jit
+def compute_dists(X1, X2, length_scales):
+    """Pairwise Euclidean distances after scaling each dimension by its length scale"""
+    diff = (X1[:, None, :] - X2[None, :, :]) / length_scales
+    return jnp.sqrt(jnp.sum(diff ** 2, axis=-1) + 1e-12)
+
+
+@jax.jit
+def matern52_kernel(X1, X2, log_params):
+    """
+    Matern 5/2 covariance.
+
+    log_params layout: [log amplitude, log length scales (n_dims), log noise]
+    """
+    amplitude = jnp.exp(log_params[0])
+    length_scales = jnp.exp(log_params[1:-1])
+    r = jnp.sqrt(5.0) * compute_dists(X1, X2, length_scales)
+    return amplitude * (1.0 + r + r ** 2 / 3.0) * jnp.exp(-r)
+
+
+def _masked_cholesky(X, mask, log_params):
+    """Cholesky of the training covariance; padded rows (mask=0) become identity"""
+    noise = jnp.exp(log_params[-1]) + JITTER
+    K = matern52_kernel(X, X, log_params) * jnp.outer(mask, mask)
+    K = K + jnp.diag(mask * noise + (1.0 - mask))
+    return jnp.linalg.cholesky(K)
+
+
+@jax.jit
+def log_marginal_likelihood(log_params, X, y, mask):
+    """Log marginal likelihood of (masked) training data"""
+    L = _masked_cholesky(X, mask, log_params)
+    alpha = cho_solve((L, True), y * mask)
+    n_valid = jnp.sum(mask)
+    return (
+        -0.5 * jnp.dot(y * mask, alpha)
+        - jnp.sum(jnp.log(jnp.diag(L)))
+        - 0.5 * n_valid * jnp.log(2.0 * jnp.pi)
+    )
+
+
+@jax.jit
+def _objective(log_params, X, y, mask):
+    """Negative LML with a weak log-normal prior keeping hyperparameters sane"""
+    return -log_marginal_likelihood(log_params, X, y, mask) + 0.5 * jnp.sum((log_params / 3.0) ** 2)
+
+
+@jax.jit
+def _fit_hyperparameters(log_params0, X, y, mask):
+    return jax_minimize(_objective, log_params0, args=(X, y, mask), method="BFGS").x
+
+
+@jax.jit
+def _posterior(Xs, X, y, mask, log_params):
+    """Posterior mean and standard deviation at Xs"""
+    L = _masked_cholesky(X, mask, log_params)
+    Ks = matern52_kernel(Xs, X, log_params) * mask
+    mu = Ks @ cho_solve((L, True), y * mask)
+    v = cho_solve((L, True), Ks.T)
+    var = jnp.exp(log_params[0]) - jnp.sum(Ks * v.T, axis=1)
+    return mu, jnp.sqrt(jnp.maximum(var, 1e-12))
+
+
+@jax.jit
+def expected_improvement(Xs, X, y, mask, log_params, y_best, xi=0.01):
+    """Closed-form Expected Improvement (for minimization) at Xs"""
+    mu, sigma = _posterior(Xs, X, y, mask, log_params)
+    improvement = y_best - mu - xi
+    z = improvement / sigma
+    return improvement * norm.cdf(z) + sigma * norm.pdf(z)
+
+
+def _neg_ei_single(x, X, y, mask, log_params, y_best):
+    return -expected_improvement(x[None, :], X, y, mask, log_params, y_best)[0]
+
+
+_neg_ei_and_grad = jax.jit(jax.value_and_grad(_neg_ei_single))
+
+
+# ============================================================================
+# SURROGATE
+# ============================================================================
+
+class JaxGP:
+    """
+    GP surrogate on the unit hypercube with a fixed-size training buffer.
+
+    Training data is padded to max_points and masked, so the jitted
+    functions compile once per optimization run instead of once per
+    iteration as the data set grows.
+    """
+
+    def __init__(self, n_dims: int, max_points: int):
+        self.n_dims = n_dims
+        self.max_points = max_points
+        self.log_params = jnp.zeros(n_dims + 2).at[-1].set(np.log(1e-4))
+        self._X = jnp.zeros((max_points, n_dims))
+        self._y = jnp.zeros(max_points)
+        self._mask = jnp.zeros(max_points)
+        self._y_mean = 0.0
+        self._y_std = 1.0
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "JaxGP":
+        """Fit hyperparameters by maximizing the log marginal likelihood"""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n = len(y)
+
+        # Normalize targets
+        self._y_mean = float(y.mean())
+        self._y_std = float(y.std()) or 1.0
+
+        X_pad = np.zeros((self.max_points, self.n_dims))
+        y_pad = np.zeros(self.max_points)
+        mask = np.zeros(self.max_points)
+        X_pad[:n] = X
+        y_pad[:n] = (y - self._y_mean) / self._y_std
+        mask[:n] = 1.0
+
+        self._X, self._y, self._mask = jnp.asarray(X_pad), jnp.asarray(y_pad), jnp.asarray(mask)
+
+        log_params = _fit_hyperparameters(self.log_params, self._X, self._y, self._mask)
+        if bool(jnp.all(jnp.isfinite(log_params))):
+            self.log_params = log_params
+        return self
+
+    def predict(self, X: np.ndarray):
+        """Posterior mean and standard deviation in original units"""
+        mu, sigma = _posterior(jnp.asarray(X, dtype=jnp.float64), self._X, self._y, self._mask, self.log_params)
+        return np.asarray(mu) * self._y_std + self._y_mean, np.asarray(sigma) * self._y_std
+
+    def propose(self, rng: np.random.Generator, n_candidates: int = 500, n_restarts: int = 5) -> np.ndarray:
+        """Maximize EI: score random candidates, then refine the best few with gradients"""
+        y_best = float(jnp.min(jnp.where(self._mask > 0, self._y, jnp.inf)))
+        args = (self._X, self._y, self._mask, self.log_params, y_best)
+
+        candidates = rng.uniform(size=(n_candidates, self.n_dims))
+        ei = np.asarray(expected_improvement(jnp.asarray(candidates), *args))
+        starts = candidates[np.argsort(ei)[-n_restarts:]]
+
+        def fun(x):
+            value, grad = _neg_ei_and_grad(jnp.asarray(x), *args)
+            return float(value), np.asarray(grad, dtype=np.float64)
+
+        best_x, best_val = starts[-1], -ei.max()
+        for x0 in starts:
+            res = minimize(fun, x0, jac=True, method="L-BFGS-B", bounds=[(0.0, 1.0)] * self.n_dims)
+            if res.success and res.fun < best_val:
+                best_x, best_val = res.x, res.fun
+
+        return np.clip(best_x, 0.0, 1.0)
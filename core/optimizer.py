@@ -5,12 +5,77 @@ Optimization engine using scikit-optimize.
 Pure Python - No Streamlit imports.
 """
 
+import functools
 import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Callable, List, Dict, Optional, Tuple
+from typing import Callable, ClassVar, Iterator, List, Dict, Optional, Sequence, Tuple, Union
 import warnings
 
-warnings.filterwarnings('ignore')
+
+@dataclass(eq=False)
+class TrialHistory:
+    """
+    Columnar record of optimization trials.
+    
+    values[i] is the objective of trial i and params[i] its parameter row
+    (columns in param_names order). Indexing or iterating yields the
+    {'params': ..., 'value': ...} dicts of the former list-of-dicts format.
+    """
+    param_names: Tuple[str, ...]
+    values: np.ndarray = None
+    params: np.ndarray = None
+    
+    CHUNK: ClassVar[int] = 64  # Buffer growth step for append()
+    
+    def __post_init__(self):
+        self.param_names = tuple(self.param_names)
+        n_vars = len(self.param_names)
+        self.values = np.empty(0) if self.values is None else np.asarray(self.values, dtype=np.float64)
+        self.params = (np.empty((0, n_vars)) if self.params is None
+                       else np.asarray(self.params, dtype=np.float64).reshape(-1, n_vars))
+        # values/params are views of the leading rows of these buffers
+        self._values_buf, self._params_buf = self.values, self.params
+    
+    @classmethod
+    def from_trials(cls, trials: List[Dict], param_names: Optional[Sequence[str]] = None) -> "TrialHistory":
+        """Build from a list of {'params': ..., 'value': ...} dicts"""
+        if param_names is None:
+            param_names = tuple(trials[0]['params']) if trials else ()
+        values = np.fromiter((t['value'] for t in trials), dtype=np.float64, count=len(trials))
+        params = np.array([[t['params'].get(name, np.nan) for name in param_names] for t in trials], dtype=np.float64)
+        return cls(param_names, values, params)
+    
+    def append(self, params: Union[Dict[str, float], Sequence[float]], value: float):
+        """Add one trial, growing the buffers by CHUNK rows when full"""
+        n = len(self.values)
+        if n == len(self._values_buf):
+            values_buf = np.empty(n + self.CHUNK)
+            params_buf = np.empty((n + self.CHUNK, len(self.param_names)))
+            values_buf[:n] = self.values
+            params_buf[:n] = self.params
+            self._values_buf, self._params_buf = values_buf, params_buf
+        
+        if isinstance(params, dict):
+            params = [params[name] for name in self.param_names]
+        self._params_buf[n] = params
+        self._values_buf[n] = value
+        self.values = self._values_buf[:n + 1]
+        self.params = self._params_buf[:n + 1]
+    
+    @property
+    def best_so_far(self) -> np.ndarray:
+        """Running maximum of the trial values"""
+        return np.maximum.accumulate(self.values)
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __getitem__(self, i: int) -> Dict:
+        return {'params': dict(zip(self.param_names, self.params[i].tolist())), 'value': float(self.values[i])}
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return (self[i] for i in range(len(self)))
 
 
 @dataclass
@@ -18,9 +83,9 @@ class OptimizationResult:
     """Container for optimization results"""
     best_params: Dict[str, float]
     best_value: float
-    all_trials: List[Dict]
-    convergence: List[float]
-    best_so_far: List[float]
+    all_trials: TrialHistory
+    convergence: np.ndarray
+    best_so_far: np.ndarray
     variable_names: List[str]
     success: bool = True
     message: str = ""
@@ -35,6 +100,10 @@ class OptimizationConfig:
     n_initial_points: int = 5
     random_state: int = 42
     maximize: bool = True
+    n_workers: int = 1  # > 1 enables asynchronous parallel Thompson sampling
+    batch_size: int = 1  # > 1 enables synchronous Kriging-Believer batches
+    gp_backend: str = 'skopt'  # 'skopt' or 'jax' (JIT-compiled GP, needs jax)
+    warm_start: bool = False  # Seed the GP with trials from earlier optimize() calls
     
     def validate(self) -> Tuple[bool, str]:
         """Validate configuration"""
@@ -44,6 +113,12 @@ class OptimizationConfig:
             return False, "Need at least 5 iterations"
         if self.n_initial_points >= self.n_iterations:
             return False, "Initial points must be less than total iterations"
+        if self.n_workers < 1:
+            return False, "Need at least 1 worker"
+        if self.batch_size < 1:
+            return False, "Batch size must be at least 1"
+        if self.gp_backend not in ('skopt', 'jax'):
+            return False, "GP backend must be 'skopt' or 'jax'"
         return True, "OK"
 
 
@@ -52,7 +127,9 @@ class BayesianOptimizer:
     Bayesian Optimization using Gaussian Process surrogate model.
     
     Uses Expected Improvement (EI) acquisition function to balance
-    exploration vs exploitation.
+    exploration vs exploitation. With batch_size > 1, proposes batches of
+    points (Kriging Believer) that are evaluated in parallel; with
+    n_workers > 1, switches to asynchronous parallel Thompson sampling.
     """
     
     def __init__(self, config: OptimizationConfig):
@@ -63,11 +140,74 @@ class BayesianOptimizer:
             config: OptimizationConfig with variable names, bounds, etc.
         """
         self.config = config
-        self.history: List[Dict] = []
+        
+        # Evaluated points/values of earlier optimize() calls, for warm starts
+        # (only kept with config.warm_start; config may be replaced between runs)
+        self._X_prev: List[np.ndarray] = []
+        self._y_prev: List[np.ndarray] = []
+        self._prev_names: Tuple[str, ...] = tuple(config.variable_names)
+        
+        self._reset_run()
+    
+    def _reset_run(self):
+        """Preallocate trial buffers (one row per iteration) for a new optimize() run"""
+        config = self.config
+        
+        # Bounds as arrays, reused by every sampling/scaling step
+        self._lows, self._highs = np.asarray(config.bounds, dtype=float).reshape(-1, 2).T
+        
+        # Earlier trials are only comparable for the same variables
+        if tuple(config.variable_names) != self._prev_names:
+            self._X_prev, self._y_prev = [], []
+            self._prev_names = tuple(config.variable_names)
+        
+        n_iterations = config.n_iterations
+        self._X = np.empty((n_iterations, len(config.variable_names)))
+        self._y = np.empty(n_iterations)
+        self._best_so_far = np.empty(n_iterations)
+        self._n_trials = 0
+        self._best_x: Optional[np.ndarray] = None
         self.best_value = float('-inf') if config.maximize else float('inf')
-        self.best_params = None
-        self.convergence = []
-        self.best_so_far = []
+        
+        # Seeded trials count toward the best result
+        self._X_warm, self._y_warm = self._warm_start_points()
+        if len(self._y_warm):
+            i = int(self._y_warm.argmax() if config.maximize else self._y_warm.argmin())
+            self.best_value = float(self._y_warm[i])
+            self._best_x = self._X_warm[i]
+    
+    @property
+    def convergence(self) -> np.ndarray:
+        """Objective value of each completed trial"""
+        return self._y[:self._n_trials]
+    
+    @property
+    def best_so_far(self) -> np.ndarray:
+        """Best objective value after each completed trial"""
+        return self._best_so_far[:self._n_trials]
+    
+    @property
+    def best_params(self) -> Optional[Dict[str, float]]:
+        """Parameters of the best trial so far (including warm-start points)"""
+        if self._best_x is None:
+            return None
+        return dict(zip(self.config.variable_names, self._best_x.tolist()))
+    
+    @property
+    def trial_history(self) -> TrialHistory:
+        """Completed trials as columns (views of this run's buffers)"""
+        n = self._n_trials
+        return TrialHistory(self.config.variable_names, self._y[:n], self._X[:n])
+    
+    @property
+    def history(self) -> List[Dict]:
+        """Completed trials as dicts with 'params' and 'value' keys"""
+        names = self.config.variable_names
+        n = self._n_trials
+        return [
+            {'params': dict(zip(names, row)), 'value': value}
+            for row, value in zip(self._X[:n].tolist(), self._y[:n].tolist())
+        ]
         
     def optimize(
         self,
@@ -85,6 +225,8 @@ class BayesianOptimizer:
         Returns:
             OptimizationResult with best parameters and history
         """
+        self._reset_run()
+        
         try:
             from skopt import gp_minimize
             from skopt.space import Real
@@ -92,11 +234,85 @@ class BayesianOptimizer:
         except ImportError:
             use_skopt = False
         
-        if use_skopt:
+        try:
+            from sklearn.gaussian_process import GaussianProcessRegressor
+            use_sklearn = True
+        except ImportError:
+            use_sklearn = False
+        
+        # Only probe for jax when asked: importing it is slow and core.jax_gp
+        # switches jax to float64 process-wide
+        use_jax = False
+        if self.config.gp_backend == 'jax':
+            try:
+                import jax
+                use_jax = True
+            except ImportError:
+                pass
+        
+        if self.config.batch_size > 1 and use_sklearn:
+            return self._optimize_batch(objective_fn, callback)
+        elif self.config.n_workers > 1 and use_sklearn:
+            return self._optimize_thompson(objective_fn, callback)
+        elif use_jax:
+            return self._optimize_with_jax(objective_fn, callback)
+        elif use_skopt:
             return self._optimize_with_skopt(objective_fn, callback)
         else:
             return self._optimize_simple(objective_fn, callback)
     
+    def _unit_to_params(self, x: np.ndarray) -> Dict[str, float]:
+        """Map a point in the unit hypercube to a params dict within bounds"""
+        values = self._lows + x * (self._highs - self._lows)
+        return dict(zip(self.config.variable_names, values.tolist()))
+    
+    def _record_trial(
+        self,
+        iteration: int,
+        params_dict: Dict[str, float],
+        value: float,
+        callback: Optional[Callable]
+    ):
+        """Store a completed trial, update best-so-far and report progress"""
+        i = self._n_trials
+        self._X[i] = [params_dict[name] for name in self.config.variable_names]
+        self._y[i] = value
+        self._n_trials += 1
+        
+        # Update best
+        if self.config.maximize:
+            if value > self.best_value:
+                self.best_value = value
+                self._best_x = self._X[i]
+        else:
+            if value < self.best_value:
+                self.best_value = value
+                self._best_x = self._X[i]
+        
+        self._best_so_far[i] = self.best_value
+        
+        # Callback for progress updates
+        if callback:
+            callback(iteration, params_dict, value)
+    
+    def _build_result(self, message: str) -> OptimizationResult:
+        """Materialize the run's trials and keep them for later warm starts"""
+        if self.config.warm_start:
+            n = self._n_trials
+            self._X_prev.append(self._X[:n])
+            self._y_prev.append(self._y[:n])
+        
+        return OptimizationResult(
+            best_params=self.best_params,
+            best_value=self.best_value,
+            all_trials=self.trial_history,
+            convergence=self.convergence,
+            best_so_far=self.best_so_far,
+            variable_names=self.config.variable_names,
+            success=True,
+            message=message
+        )
+    
     def _optimize_with_skopt(
         self,
         objective_fn: Callable,
@@ -124,105 +340,286 @@ class BayesianOptimizer:
             # Evaluate objective
             value = objective_fn(params_dict)
             
-            # Store in history
-            self.history.append({
-                'params': params_dict.copy(),
-                'value': value
-            })
-            self.convergence.append(value)
-            
-            # Update best
-            if self.config.maximize:
-                if value > self.best_value:
-                    self.best_value = value
-                    self.best_params = params_dict.copy()
-            else:
-                if value < self.best_value:
-                    self.best_value = value
-                    self.best_params = params_dict.copy()
-            
-            self.best_so_far.append(self.best_value)
-            
-            # Callback for progress updates
+            # Store in history and update best
             iteration_count[0] += 1
-            if callback:
-                callback(iteration_count[0], params_dict, value)
+            self._record_trial(iteration_count[0], params_dict, value, callback)
             
             # Return negative for maximization (skopt minimizes)
             return -value if self.config.maximize else value
         
-        # Run optimization
-        result = gp_minimize(
-            wrapped_objective,
-            space,
-            n_calls=self.config.n_iterations,
-            n_initial_points=self.config.n_initial_points,
-            random_state=self.config.random_state,
-            acq_func='EI',  # Expected Improvement
-            verbose=False
-        )
+        # Warm start: reuse earlier evaluations instead of a fresh random design
+        initial_design = {'n_initial_points': self.config.n_initial_points}
+        if len(self._y_warm):
+            y0 = -self._y_warm if self.config.maximize else self._y_warm
+            initial_design = {'x0': self._X_warm.tolist(), 'y0': y0.tolist(), 'n_initial_points': 0}
         
-        return OptimizationResult(
-            best_params=self.best_params,
-            best_value=self.best_value,
-            all_trials=self.history,
-            convergence=self.convergence,
-            best_so_far=self.best_so_far,
-            variable_names=self.config.variable_names,
-            success=True,
-            message=f"Optimization completed: {len(self.history)} trials"
-        )
+        # Run optimization (skopt warns on GP convergence and repeated points)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = gp_minimize(
+                wrapped_objective,
+                space,
+                n_calls=self.config.n_iterations,
+                random_state=self.config.random_state,
+                acq_func='EI',  # Expected Improvement
+                verbose=False,
+                **initial_design
+            )
+        
+        return self._build_result(f"Optimization completed: {self._n_trials} trials")
     
-    def _optimize_simple(
+    def _warm_start_points(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Earlier trials inside the current bounds (params, raw objective values)"""
+        n_dims = len(self.config.variable_names)
+        if not (self.config.warm_start and self._X_prev):
+            return np.empty((0, n_dims)), np.empty(0)
+        
+        X = np.concatenate(self._X_prev)
+        inside = np.all((X >= self._lows) & (X <= self._highs), axis=1)
+        return X[inside], np.concatenate(self._y_prev)[inside]
+    
+    def _warm_start_unit(self) -> Tuple[List[np.ndarray], List[float]]:
+        """Warm-start points in the unit hypercube, sign flipped for maximization (GP training data)"""
+        span = np.where(self._highs > self._lows, self._highs - self._lows, 1.0)
+        X = list((self._X_warm - self._lows) / span)
+        y = (-self._y_warm if self.config.maximize else self._y_warm).tolist()
+        return X, y
+    
+    def _optimize_with_jax(
         self,
         objective_fn: Callable,
         callback: Optional[Callable]
     ) -> OptimizationResult:
-        """Simple random search fallback if skopt not available"""
+        """Sequential EI optimization on a JIT-compiled JAX GP"""
+        from .jax_gp import JaxGP
+        
+        n_dims = len(self.config.variable_names)
+        n_total = self.config.n_iterations
+        
+        rng = np.random.default_rng(self.config.random_state)
         
-        np.random.seed(self.config.random_state)
+        # Trials in the unit hypercube, objective sign flipped for maximization
+        X, y = self._warm_start_unit()
+        n_initial = 0 if X else self.config.n_initial_points
+        gp = JaxGP(n_dims, max_points=len(X) + n_total)
         
-        for i in range(self.config.n_iterations):
-            # Generate random parameters within bounds
-            params_dict = {}
-            for name, (low, high) in zip(self.config.variable_names, self.config.bounds):
-                params_dict[name] = np.random.uniform(low, high)
+        for i in range(n_total):
+            if i < n_initial:
+                x = rng.uniform(size=n_dims)
+            else:
+                gp.fit(np.array(X), np.array(y))
+                x = gp.propose(rng, n_candidates=_N_CANDIDATES)
             
-            # Evaluate
+            params_dict = self._unit_to_params(x)
             value = objective_fn(params_dict)
+            self._record_trial(i + 1, params_dict, value, callback)
             
-            # Store
-            self.history.append({
-                'params': params_dict.copy(),
-                'value': value
-            })
-            self.convergence.append(value)
+            X.append(x)
+            y.append(-value if self.config.maximize else value)
+        
+        return self._build_result(f"Optimization completed: {self._n_trials} trials (JAX GP)")
+    
+    def _optimize_thompson(
+        self,
+        objective_fn: Callable,
+        callback: Optional[Callable]
+    ) -> OptimizationResult:
+        """
+        Asynchronous parallel Thompson sampling.
+        
+        Keeps n_workers reactor simulations in flight. Whenever one
+        finishes, the GP is refit on all completed trials and each idle
+        worker receives the minimizer of a fresh GP posterior sample.
+        """
+        n_dims = len(self.config.variable_names)
+        n_total = self.config.n_iterations
+        n_workers = self.config.n_workers
+        
+        rng = np.random.default_rng(self.config.random_state)
+        gp = _make_gp(n_dims, self.config.random_state)
+        
+        # Completed trials in the unit hypercube, objective sign flipped for maximization
+        X, y = self._warm_start_unit()
+        n_initial = 0 if X else self.config.n_initial_points
+        if X:
+            _fit_gp(gp, X, y)
+        
+        def propose(n_submitted):
+            if n_submitted < n_initial:
+                return rng.uniform(size=n_dims)
+            candidates = rng.uniform(size=(_N_CANDIDATES, n_dims))
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                f_tilde = gp.sample_y(candidates, 1, random_state=int(rng.integers(2**31 - 1)))
+            return candidates[np.argmin(f_tilde.ravel())]
+        
+        pending = {}
+        n_submitted = 0
+        n_completed = 0
+        
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
             
-            # Update best
-            if self.config.maximize:
-                if value > self.best_value:
-                    self.best_value = value
-                    self.best_params = params_dict.copy()
-            else:
-                if value < self.best_value:
-                    self.best_value = value
-                    self.best_params = params_dict.copy()
+            def submit():
+                nonlocal n_submitted
+                x = propose(n_submitted)
+                params_dict = self._unit_to_params(x)
+                pending[executor.submit(objective_fn, params_dict)] = (x, params_dict)
+                n_submitted += 1
             
-            self.best_so_far.append(self.best_value)
+            while n_submitted < min(n_workers, n_total):
+                submit()
             
-            if callback:
-                callback(i + 1, params_dict, value)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    x, params_dict = pending.pop(future)
+                    value = future.result()
+                    
+                    n_completed += 1
+                    self._record_trial(n_completed, params_dict, value, callback)
+                    
+                    X.append(x)
+                    y.append(-value if self.config.maximize else value)
+                
+                # Refit surrogate once past the random initial design
+                if n_submitted >= n_initial:
+                    _fit_gp(gp, X, y)
+                
+                while n_submitted < n_total and len(pending) < n_workers:
+                    submit()
         
-        return OptimizationResult(
-            best_params=self.best_params,
-            best_value=self.best_value,
-            all_trials=self.history,
-            convergence=self.convergence,
-            best_so_far=self.best_so_far,
-            variable_names=self.config.variable_names,
-            success=True,
-            message="Optimization completed (random search fallback)"
-        )
+        return self._build_result(f"Optimization completed: {self._n_trials} trials ({n_workers} parallel workers)")
+    
+    def _optimize_batch(
+        self,
+        objective_fn: Callable,
+        callback: Optional[Callable]
+    ) -> OptimizationResult:
+        """Synchronous batch optimization, evaluating each batch in parallel"""
+        n_dims = len(self.config.variable_names)
+        n_total = self.config.n_iterations
+        batch_size = self.config.batch_size
+        
+        rng = np.random.default_rng(self.config.random_state)
+        gp = _make_gp(n_dims, self.config.random_state)
+        
+        # Completed trials in the unit hypercube, objective sign flipped for maximization
+        X, y = self._warm_start_unit()
+        n_warm = len(X)
+        n_initial = 0 if n_warm else self.config.n_initial_points
+        
+        with ProcessPoolExecutor(max_workers=batch_size) as executor:
+            while len(X) - n_warm < n_total:
+                q = min(batch_size, n_total - (len(X) - n_warm))
+                
+                if len(X) - n_warm < n_initial:
+                    batch = rng.uniform(size=(q, n_dims))
+                else:
+                    _fit_gp(gp, X, y)
+                    batch = self._propose_batch(gp, X, y, q, rng)
+                
+                params_list = [self._unit_to_params(x) for x in batch]
+                values = list(executor.map(objective_fn, params_list))
+                
+                for x, params_dict, value in zip(batch, params_list, values):
+                    X.append(x)
+                    y.append(-value if self.config.maximize else value)
+                    self._record_trial(len(X) - n_warm, params_dict, value, callback)
+        
+        return self._build_result(f"Optimization completed: {self._n_trials} trials (batches of {batch_size})")
+    
+    def _propose_batch(self, gp, X: List, y: List, q: int, rng) -> np.ndarray:
+        """
+        Propose q points with the Kriging-Believer heuristic.
+        
+        Each point maximizes EI; it is then appended with the GP posterior
+        mean as a hallucinated observation and the GP is refit (keeping the
+        fitted hyperparameters) before proposing the next point. The
+        caller's gp, X and y are left untouched.
+        """
+        from sklearn.base import clone
+        
+        believer = clone(gp).set_params(kernel=gp.kernel_, optimizer=None)
+        X_fant, y_fant = list(X), list(y)
+        model = gp
+        batch = []
+        
+        for j in range(q):
+            if j > 0:
+                model = _fit_gp(believer, X_fant, y_fant)
+            
+            candidates = rng.uniform(size=(_N_CANDIDATES, len(X_fant[0])))
+            ei = _expected_improvement(model, candidates, min(y_fant))
+            x = candidates[np.argmax(ei)]
+            
+            batch.append(x)
+            X_fant.append(x)
+            y_fant.append(float(model.predict(x[None, :])[0]))
+        
+        return np.array(batch)
+    
+    def _optimize_simple(
+        self,
+        objective_fn: Callable,
+        callback: Optional[Callable]
+    ) -> OptimizationResult:
+        """Simple random search fallback if skopt not available (parallel if n_workers > 1)"""
+        
+        # Draw all random parameter sets within bounds upfront
+        rng = np.random.default_rng(self.config.random_state)
+        samples = rng.uniform(self._lows, self._highs, (self.config.n_iterations, len(self._lows)))
+        params_list = [dict(zip(self.config.variable_names, vec)) for vec in samples.tolist()]
+        
+        # Evaluate (trials are independent, so they can all run at once)
+        values = _map_objective(objective_fn, params_list, self.config.n_workers)
+        
+        for i, (params_dict, value) in enumerate(zip(params_list, values)):
+            # Store and update best
+            self._record_trial(i + 1, params_dict, value, callback)
+        
+        return self._build_result("Optimization completed (random search fallback)")
+
+
+# Number of random candidate points used to optimize acquisition functions
+_N_CANDIDATES = 500
+
+
+def _make_gp(n_dims: int, random_state: int):
+    """Create a GP surrogate (Matern 5/2 + noise) for inputs scaled to the unit hypercube"""
+    from sklearn.gaussian_process import GaussianProcessRegressor
+    from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+    
+    kernel = (
+        ConstantKernel(1.0, (1e-3, 1e3))
+        * Matern(length_scale=np.ones(n_dims), length_scale_bounds=(1e-2, 1e2), nu=2.5)
+        + WhiteKernel(1e-6, (1e-10, 1e-1))
+    )
+    return GaussianProcessRegressor(
+        kernel=kernel,
+        normalize_y=True,
+        n_restarts_optimizer=2,
+        random_state=random_state
+    )
+
+
+def _fit_gp(gp, X: List, y: List):
+    """Fit a scikit-learn GP, silencing hyperparameter convergence warnings"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return gp.fit(np.asarray(X), np.asarray(y))
+
+
+def _expected_improvement(gp, candidates: np.ndarray, y_best: float, xi: float = 0.01) -> np.ndarray:
+    """Expected Improvement (for minimization) of GP at candidate points"""
+    from scipy.stats import norm
+    
+    mu, sigma = gp.predict(candidates, return_std=True)
+    improvement = y_best - mu - xi
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = improvement / sigma
+        ei = improvement * norm.cdf(z) + sigma * norm.pdf(z)
+    return np.where(sigma > 0, ei, 0.0)
 
 
 class SensitivityAnalyzer:
@@ -239,7 +636,9 @@ class SensitivityAnalyzer:
         self,
         objective_fn: Callable[[Dict[str, float]], float],
         n_samples: int = 50,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        n_workers: int = 1,
+        batched: bool = False
     ) -> Dict[str, float]:
         """
         Run sensitivity analysis.
@@ -248,6 +647,10 @@ class SensitivityAnalyzer:
             objective_fn: Objective function
             n_samples: Number of samples per parameter
             callback: Progress callback
+            n_workers: Number of worker processes (1 = serial evaluation).
+                       objective_fn must be picklable when n_workers > 1.
+            batched: If True, objective_fn takes the list of all parameter
+                     dicts and returns a sequence of objective values
         
         Returns:
             Dictionary of parameter_name -> importance_score (0-1)
@@ -259,101 +662,269 @@ class SensitivityAnalyzer:
             for name, (low, high) in zip(self.variable_names, self.bounds)
         }
         
-        importance_scores = {}
-        total_iterations = len(self.variable_names) * n_samples
-        current_iter = 0
-        
-        for var_idx, (var_name, (low, high)) in enumerate(zip(self.variable_names, self.bounds)):
-            values = []
-            
-            # Sweep this parameter while holding others at base
-            test_values = np.linspace(low, high, n_samples)
-            
-            for test_val in test_values:
+        # Build the whole (variable, sample) grid upfront: sweep each
+        # parameter while holding others at base
+        all_params = []
+        grid_points = []
+        for var_name, (low, high) in zip(self.variable_names, self.bounds):
+            for test_val in np.linspace(low, high, n_samples):
                 params = base_params.copy()
                 params[var_name] = test_val
-                
-                result = objective_fn(params)
-                values.append(result)
-                
-                current_iter += 1
-                if callback:
-                    callback(current_iter, total_iterations, var_name, test_val, result)
-            
-            # Calculate variance for this parameter
-            importance_scores[var_name] = np.std(values)
+                all_params.append(params)
+                grid_points.append((var_name, test_val))
+        
+        total_iterations = len(all_params)
         
-        # Normalize to sum to 1
-        total = sum(importance_scores.values())
-        if total > 0:
-            importance_scores = {k: v/total for k, v in importance_scores.items()}
+        if batched:
+            results = objective_fn(all_params)
+        else:
+            results = _map_objective(
+                objective_fn, all_params, n_workers,
+                chunksize=max(1, n_samples // max(1, n_workers))
+            )
         
-        return importance_scores
+        # Collect into a (variable, sample) array
+        values = np.empty((len(self.variable_names), n_samples))
+        flat_values = values.reshape(-1)
+        for i, ((var_name, test_val), result) in enumerate(zip(grid_points, results)):
+            flat_values[i] = result
+            if callback:
+                callback(i + 1, total_iterations, var_name, test_val, result)
+        
+        # Importance = spread of each parameter's sweep, normalized to sum to 1
+        stds = values.std(axis=1)
+        stds = stds / (stds.sum() or 1.0)
+        
+        return dict(zip(self.variable_names, stds.tolist()))
+
+
+def _map_objective(
+    objective_fn: Callable[[Dict[str, float]], float],
+    params_list: List[Dict[str, float]],
+    n_workers: int = 1,
+    chunksize: int = 1
+) -> Iterator[float]:
+    """Evaluate objective_fn over params_list in order, using worker processes if n_workers > 1"""
+    if n_workers <= 1:
+        yield from map(objective_fn, params_list)
+        return
+    
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        yield from executor.map(objective_fn, params_list, chunksize=chunksize)
+
+
+# Optimizer units -> SI units for reactor config: SI = value * factor + offset
+_UNIT_CONVERSIONS = {
+    'inlet_temperature': (1.0, 273.15),      # °C to K
+    'flow_rate': (1 / 60 / 1e6, 0.0),        # mL/min to m³/s
+    'particle_diameter': (1e-6, 0.0),        # μm to m
+    'bed_height': (1 / 100, 0.0),            # cm to m
+    'catalyst_mass': (1 / 1000, 0.0),        # g to kg
+    'inlet_pressure': (1e5, 0.0),            # bar to Pa
+}
+
+
+def _quantize(value: float, sig_figs: int = 6) -> float:
+    """Round to a number of significant figures (cache key for objective evaluations)"""
+    return float(f'{value:.{sig_figs}g}')
 
 
-def create_objective_function(reactor_class, base_config: dict, variable_names: List[str], target: str):
+class _ReactorObjective:
     """
-    Factory function to create objective function for optimizer.
+    Objective function evaluating the reactor model for a param dict.
     
-    Args:
-        reactor_class: MethaneDecompositionReactor class
-        base_config: Base configuration dictionary
-        variable_names: List of parameters to optimize
-        target: Output variable to optimize (e.g., 'V_dot_H2_Nm3_h')
+    Defined at module level (rather than as a closure) so it can be
+    pickled and dispatched to worker processes. The model is deterministic,
+    so evaluations are LRU-cached on the params rounded to 6 significant figures.
     
-    Returns:
-        Callable that takes param dict and returns objective value
+    Template constraints are checked before the solve with cheap bounds
+    (pressure drop, conversion) and again on the solved outlet values;
+    violating trials score infeasible_value.
     """
     
-    def objective(params: Dict[str, float]) -> float:
-        # Start with base config
-        config_dict = base_config.copy()
-        
-        # Update with optimization parameters (handle unit conversions)
-        for name, value in params.items():
-            if name == 'inlet_temperature':
-                config_dict['inlet_temperature'] = value + 273.15  # °C to K
-            elif name == 'flow_rate':
-                config_dict['flow_rate'] = value / 60 / 1e6  # mL/min to m³/s
-            elif name == 'particle_diameter':
-                config_dict['particle_diameter'] = value * 1e-6  # μm to m
-            elif name == 'bed_height':
-                config_dict['bed_height'] = value / 100  # cm to m
-            elif name == 'catalyst_mass':
-                config_dict['catalyst_mass'] = value / 1000  # g to kg
-            elif name == 'inlet_pressure':
-                config_dict['inlet_pressure'] = value * 1e5  # bar to Pa
-            else:
-                config_dict[name] = value
+    CACHE_SIZE = 1024
+    
+    def __init__(
+        self,
+        base_config: dict,
+        variable_names: List[str],
+        target: str,
+        solver_tol: str = 'refinement',
+        constraints: Optional[List[dict]] = None,
+        infeasible_value: float = 0.0
+    ):
+        self.base_config = base_config
+        self.variable_names = variable_names
+        self.target = target
+        self.solver_tol = solver_tol
+        self.constraints = [(c['key'], c['type'], float(c['default_value'])) for c in constraints or []]
+        self.infeasible_value = infeasible_value
+        
+        # One (config key, factor, offset) per variable, aligned with variable_names
+        self._conversions = tuple((n, *_UNIT_CONVERSIONS.get(n, (1.0, 0.0))) for n in variable_names)
+        
+        self._cached_evaluate = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._evaluate)
+    
+    def __getstate__(self):
+        # The cache wraps a bound method and is not picklable - workers build their own
+        state = self.__dict__.copy()
+        del state['_cached_evaluate']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_evaluate = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._evaluate)
+    
+    def __call__(self, params: Dict[str, float]) -> float:
+        key = tuple(_quantize(params[name]) for name in self.variable_names)
+        return self._cached_evaluate(key)
+    
+    def _config_dict(self, key: Tuple[float, ...]) -> dict:
+        """Base config with the (unit-converted) param values applied"""
+        config_dict = self.base_config.copy()
+        for (name, factor, offset), value in zip(self._conversions, key):
+            config_dict[name] = value * factor + offset
+        return config_dict
+    
+    def _target_value(self, results: dict, params: Dict[str, float]) -> float:
+        """Extract the objective value from reactor outlet values (solve_terminal)"""
+        return self._output_value(results, params, self.target)
+    
+    @staticmethod
+    def _output_value(results: dict, params: Dict[str, float], target: str) -> float:
+        """Reactor output in optimizer units (objective targets and constraint keys)"""
+        if target == 'X_CH4':
+            return float(results['X_CH4'] * 100)  # Convert to percentage
+        elif target == 'V_dot_H2_Nm3_h':
+            return float(results['V_dot_H2_Nm3_h'])
+        elif target == 'pressure_drop':
+            return float(results['pressure_drop'] / 1000)  # kPa
+        elif target == 'inlet_temperature':
+            return float(params.get('inlet_temperature', 900))
+        else:
+            return float(results.get(target, 0.0))
+    
+    def _prescreen(self, reactor_config) -> bool:
+        """False if a constraint is certainly violated, judged from inlet-only bounds"""
+        from reactor_model import prescreen_pressure_drop, prescreen_max_conversion
+        
+        for key, kind, limit in self.constraints:
+            if key == 'pressure_drop' and kind == '<=':
+                if prescreen_pressure_drop(reactor_config) / 1000 > limit:  # kPa
+                    return False
+            elif key == 'X_CH4' and kind == '>=':
+                if prescreen_max_conversion(reactor_config) * 100 < limit:  # %
+                    return False
+        return True
+    
+    def _feasible(self, results: dict, params: Dict[str, float]) -> bool:
+        """Check all constraints on the solved outlet values"""
+        for key, kind, limit in self.constraints:
+            value = self._output_value(results, params, key)
+            if (kind == '<=' and value > limit) or (kind == '>=' and value < limit):
+                return False
+        return True
+    
+    def _evaluate(self, key: Tuple[float, ...]) -> float:
+        """Run the reactor model for quantized param values (in variable_names order)"""
+        params = dict(zip(self.variable_names, key))
+        
+        # Start with base config and apply optimization parameters (with unit conversions)
+        config_dict = self._config_dict(key)
         
         try:
             # Import here to avoid circular imports
-            from reactor_model import ReactorConfig, MethaneDecompositionReactor
+            from reactor_model import ReactorConfig, MethaneDecompositionReactor, SOLVER_TOLERANCES
             
             # Create reactor config
             reactor_config = ReactorConfig(**config_dict)
             
-            # Run simulation
+            # Skip the solve when a constraint is violated regardless of the profile
+            if not self._prescreen(reactor_config):
+                return self.infeasible_value
+            
+            # Run simulation (extreme trial parameters can overflow intermediate terms)
             reactor = MethaneDecompositionReactor(reactor_config, isothermal=True)
-            results = reactor.solve()
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                results = reactor.solve_terminal(**SOLVER_TOLERANCES[self.solver_tol])
+            
+            if not self._feasible(results, params):
+                return self.infeasible_value
             
             # Get target value
-            if target == 'X_CH4':
-                return float(results['X_CH4'][-1] * 100)  # Convert to percentage
-            elif target == 'V_dot_H2_Nm3_h':
-                return float(results['V_dot_H2_Nm3_h'][-1])
-            elif target == 'pressure_drop':
-                return float((config_dict['inlet_pressure'] - results['P'][-1]) / 1000)  # kPa
-            elif target == 'inlet_temperature':
-                return float(params.get('inlet_temperature', 900))
-            else:
-                return float(results.get(target, [0])[-1])
+            return self._target_value(results, params)
                 
-        except Exception as e:
-            # Return bad value on error
-            return 0.0
+        except Exception:
+            # A failed solve scores like an infeasible trial
+            return self.infeasible_value
+
+
+class _BatchedReactorObjective(_ReactorObjective):
+    """
+    Objective evaluating a list of param dicts in one vectorized reactor solve.
+    
+    Intended for SensitivityAnalyzer.analyze(batched=True). If the batched
+    solve fails, points are evaluated one by one instead.
+    """
+    
+    def __call__(self, params_list: List[Dict[str, float]]) -> np.ndarray:
+        keys = [tuple(_quantize(params[name]) for name in self.variable_names) for params in params_list]
+        
+        try:
+            from reactor_model import ReactorConfig, BatchedMethaneDecompositionReactor, SOLVER_TOLERANCES
+            
+            # Only prescreened-feasible points go into the batched solve
+            configs = [ReactorConfig(**self._config_dict(key)) for key in keys]
+            solve_idx = [i for i, cfg in enumerate(configs) if self._prescreen(cfg)]
+            values = np.full(len(keys), self.infeasible_value, dtype=np.float64)
+            if not solve_idx:
+                return values
+            
+            reactor = BatchedMethaneDecompositionReactor([configs[i] for i in solve_idx], isothermal=True)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                all_results = reactor.solve_terminal(**SOLVER_TOLERANCES[self.solver_tol])
+            
+            for i, results in zip(solve_idx, all_results):
+                params = dict(zip(self.variable_names, keys[i]))
+                if self._feasible(results, params):
+                    values[i] = self._target_value(results, params)
+            return values
+        
+        except Exception:
+            return np.array([self._cached_evaluate(key) for key in keys])
+
+
+def create_objective_function(
+    reactor_class,
+    base_config: dict,
+    variable_names: List[str],
+    target: str,
+    solver_tol: str = 'refinement',
+    batched: bool = False,
+    constraints: Optional[List[dict]] = None,
+    infeasible_value: float = 0.0
+):
+    """
+    Factory function to create objective function for optimizer.
     
-    return objective
+    Args:
+        reactor_class: MethaneDecompositionReactor class
+        base_config: Base configuration dictionary
+        variable_names: List of parameters to optimize
+        target: Output variable to optimize (e.g., 'V_dot_H2_Nm3_h')
+        solver_tol: ODE tolerance preset - 'screening' (LSODA, loose) or 'refinement' (RK45, tight)
+        batched: If True, the callable takes a list of param dicts and solves them
+                 together as one vectorized system (see SensitivityAnalyzer.analyze)
+        constraints: Template constraint dicts ('key', 'type' '<=' / '>=', 'default_value')
+        infeasible_value: Objective value returned for trials violating a constraint
+    
+    Returns:
+        Picklable callable that takes param dict and returns objective value
+    """
+    objective_class = _BatchedReactorObjective if batched else _ReactorObjective
+    return objective_class(base_config, variable_names, target, solver_tol, constraints, infeasible_value)
 
 
 def get_base_config_from_session(session_state) -> dict:
@@ -0,0 +1,139 @@
+"""
+Anukaran AI - Morris Sensitivity Screening
+==========================================
+Elementary-effects (Morris) screening for ranking parameter importance.
+Needs only r * (k + 1) objective evaluations for k parameters.
+Pure Python - No Streamlit imports.
+"""
+
+import numpy as np
+from typing import Callable, List, Dict, Optional, Tuple
+
+from .optimizer import _map_objective
+
+
+class MorrisAnalyzer:
+    """
+    Morris elementary-effects screening.
+
+    Each of the r trajectories starts at a random point of a p-level grid
+    on the unit hypercube and moves one parameter at a time by +/-delta,
+    delta = p / (2 (p - 1)). The elementary effect of parameter i is the
+    change in objective per unit (normalized) step along i.
+
+    mu* (mean |EE|) ranks overall importance; sigma (std of EE) flags
+    non-linear effects and interactions with other parameters.
+    """
+
+    def __init__(
+        self,
+        variable_names: List[str],
+        bounds: List[Tuple[float, float]],
+        n_trajectories: int = 6,
+        n_levels: int = 4,
+        random_state: int = 42
+    ):
+        self.variable_names = list(variable_names)
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 2)
+        self.n_trajectories = n_trajectories
+        self.n_levels = n_levels
+        self.random_state = random_state
+
+        self.mu_star: Dict[str, float] = {}
+        self.sigma: Dict[str, float] = {}
+
+    @property
+    def delta(self) -> float:
+        return self.n_levels / (2 * (self.n_levels - 1))
+
+    @property
+    def n_evaluations(self) -> int:
+        return self.n_trajectories * (len(self.variable_names) + 1)
+
+    def _trajectories(self, rng: np.random.Generator):
+        """
+        Build all trajectories in the unit hypercube.
+
+        Returns:
+            points: (r, k + 1, k) array of trajectory points
+            order: (r, k) parameter moved at each step
+            steps: (r, k) signed step (+/-delta) of each moved parameter
+        """
+        r, k, delta = self.n_trajectories, len(self.variable_names), self.delta
+        levels = np.linspace(0.0, 1.0, self.n_levels)
+        # Start levels from which a step of +delta stays inside [0, 1]
+        start_levels = levels[levels <= 1.0 - delta + 1e-12]
+
+        signs = rng.choice([-1.0, 1.0], size=(r, k))
+        x0 = rng.choice(start_levels, size=(r, k))
+        x0 = np.where(signs > 0, x0, x0 + delta)
+        order = np.argsort(rng.random((r, k)), axis=1)
+
+        points = np.empty((r, k + 1, k))
+        points[:, 0] = x0
+        for j in range(k):
+            points[:, j + 1] = points[:, j]
+            moved = order[:, j]
+            points[np.arange(r), j + 1, moved] += signs[np.arange(r), moved] * delta
+
+        steps = np.take_along_axis(signs, order, axis=1) * delta
+        return points, order, steps
+
+    def analyze(
+        self,
+        objective_fn: Callable[[Dict[str, float]], float],
+        callback: Optional[Callable] = None,
+        n_workers: int = 1,
+        batched: bool = False
+    ) -> Dict[str, float]:
+        """
+        Run Morris screening.
+
+        Args:
+            objective_fn: Objective function
+            callback: Progress callback(iteration, total, params, value)
+            n_workers: Number of worker processes (1 = serial evaluation).
+                       objective_fn must be picklable when n_workers > 1.
+            batched: If True, objective_fn takes the list of all parameter
+                     dicts and returns a sequence of objective values
+
+        Returns:
+            Dictionary of parameter_name -> importance_score (normalized mu*, 0-1).
+            Raw mu* and sigma are kept in self.mu_star / self.sigma.
+        """
+        rng = np.random.default_rng(self.random_state)
+        points, order, steps = self._trajectories(rng)
+        r, n_steps, k = points.shape
+
+        # Scale the unit-cube design to the variable bounds
+        lows, highs = self.bounds[:, 0], self.bounds[:, 1]
+        scaled = lows + points.reshape(-1, k) * (highs - lows)
+        all_params = [dict(zip(self.variable_names, row.tolist())) for row in scaled]
+        total_iterations = len(all_params)
+
+        if batched:
+            results = objective_fn(all_params)
+        else:
+            results = _map_objective(
+                objective_fn, all_params, n_workers,
+                chunksize=max(1, n_steps // max(1, n_workers))
+            )
+
+        values = np.empty(total_iterations)
+        for i, (params, result) in enumerate(zip(all_params, results)):
+            values[i] = result
+            if callback:
+                callback(i + 1, total_iterations, params, result)
+
+        # Elementary effects, scattered back to parameter order
+        values = values.reshape(r, n_steps)
+        effects = np.empty((r, k))
+        np.put_along_axis(effects, order, np.diff(values, axis=1) / steps, axis=1)
+
+        mu_star = np.abs(effects).mean(axis=0)
+        sigma = effects.std(axis=0, ddof=1) if r > 1 else np.zeros(k)
+        self.mu_star = dict(zip(self.variable_names, mu_star.tolist()))
+        self.sigma = dict(zip(self.variable_names, sigma.tolist()))
+
+        importance = mu_star / (mu_star.sum() or 1.0)
+        return dict(zip(self.variable_names, importance.tolist()))
@@ -4,6 +4,8 @@ Anukaran AI - Optimization Problem Templates
 Pre-defined optimization scenarios for methane decomposition reactor.
 """
 
+import numpy as np
+
 OPTIMIZATION_TEMPLATES = {
     
     "max_h2": {
@@ -51,6 +53,7 @@ OPTIMIZATION_TEMPLATES = {
                 "unit": "kPa"
             }
         ],
+        "solver_tol": "screening",
         "suggested_iterations": 25,
         "ai_hint": "High temperature increases reaction rate exponentially. Focus on 850-1000°C range first."
     },
@@ -100,6 +103,7 @@ OPTIMIZATION_TEMPLATES = {
                 "unit": "kPa"
             }
         ],
+        "solver_tol": "refinement",
         "suggested_iterations": 20,
         "ai_hint": "Longer residence time (low flow, tall bed) improves conversion. Watch pressure drop."
     },
@@ -156,6 +160,7 @@ OPTIMIZATION_TEMPLATES = {
                 "unit": "Nm³/h"
             }
         ],
+        "solver_tol": "refinement",
         "suggested_iterations": 30,
         "ai_hint": "Trade-off between temperature and catalyst amount. More catalyst allows lower temperature."
     },
@@ -205,8 +210,10 @@ OPTIMIZATION_TEMPLATES = {
             },
         ],
         "constraints": [],
-        "suggested_iterations": 40,
-        "ai_hint": "This will run multiple simulations to rank parameter importance using variance-based sensitivity."
+        "method": "morris",
+        "solver_tol": "screening",
+        "suggested_iterations": 30,
+        "ai_hint": "This will run multiple simulations to rank parameter importance using Morris elementary-effects screening."
     },
 }
 
@@ -221,17 +228,28 @@ def get_template_names() -> dict:
     return {key: val["name"] for key, val in OPTIMIZATION_TEMPLATES.items()}
 
 
-def get_variable_bounds(template_key: str) -> list:
-    """Extract variable bounds as list of tuples for optimizer"""
-    template = get_template(template_key)
-    bounds = []
-    for var in template["variables"]:
-        if var.get("default_optimize", True):
-            bounds.append((var["min"], var["max"]))
-    return bounds
+def get_variable_bounds(template_key: str) -> np.ndarray:
+    """Variable bounds as a read-only (n_vars, 2) array of [min, max] rows for the optimizer"""
+    return _BOUNDS_CACHE.get(template_key, _BOUNDS_CACHE["max_h2"])
 
 
-def get_variable_names(template_key: str) -> list:
+def get_variable_names(template_key: str) -> tuple:
     """Extract variable keys for optimizer"""
-    template = get_template(template_key)
-    return [var["key"] for var in template["variables"] if var.get("default_optimize", True)]
\ No newline at end of file
+    return _NAMES_CACHE.get(template_key, _NAMES_CACHE["max_h2"])
+
+
+def _freeze_bounds(template: dict) -> np.ndarray:
+    bounds = np.array(
+        [(var["min"], var["max"]) for var in template["variables"] if var.get("default_optimize", True)],
+        dtype=np.float64
+    ).reshape(-1, 2)
+    bounds.flags.writeable = False  # Shared between callers
+    return bounds
+
+
+# Precomputed at import - templates are static
+_BOUNDS_CACHE = {key: _freeze_bounds(template) for key, template in OPTIMIZATION_TEMPLATES.items()}
+_NAMES_CACHE = {
+    key: tuple(var["key"] for var in template["variables"] if var.get("default_optimize", True))
+    for key, template in OPTIMIZATION_TEMPLATES.items()
+}
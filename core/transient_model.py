@@ -5,13 +5,14 @@ Unsteady-state packed bed reactor with catalyst deactivation.
 Reaction: CH4 → C + 2H2
 """
 
+import math
 import numpy as np
 from scipy.integrate import solve_ivp
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional, Callable
 import warnings
 
-warnings.filterwarnings('ignore')
+from reactor_model import njit  # Numba njit, or the plain-Python fallback when Numba is missing
 
 # Physical constants
 R_GAS = 8.314
@@ -33,9 +34,41 @@ class DeactivationParams:
     E_d: float = 50000.0       # Deactivation activation energy [J/mol]
     T_ref: float = 1073.15     # Reference temperature [K] (800°C)
     
+    def __post_init__(self):
+        self._E_d_over_R = self.E_d / R_GAS
+        self._inv_Tref = 1.0 / self.T_ref
+    
     def get_kd_at_temperature(self, T: float) -> float:
         """Get temperature-dependent deactivation rate constant"""
-        return self.k_d * np.exp(-self.E_d / R_GAS * (1/T - 1/self.T_ref))
+        return self.k_d * math.exp(self._E_d_over_R * (self._inv_Tref - 1.0 / T))
+
+
+@njit(cache=True)
+def _rate_linear(activity, k_d, C_CH4):
+    return -k_d
+
+
+@njit(cache=True)
+def _rate_first(activity, k_d, C_CH4):
+    return -k_d * activity
+
+
+@njit(cache=True)
+def _rate_second(activity, k_d, C_CH4):
+    return -k_d * activity ** 2
+
+
+@njit(cache=True)
+def _rate_coking(activity, k_d, C_CH4):
+    return -k_d * activity * (C_CH4 * 1000)  # Convert to mol/m³
+
+
+_RATE_FUNCTIONS = {
+    'linear': _rate_linear,
+    'first_order': _rate_first,
+    'second_order': _rate_second,
+    'coking': _rate_coking,
+}
 
 
 class DeactivationModel:
@@ -52,6 +85,8 @@ class DeactivationModel:
     def __init__(self, model_type: str = 'first_order', params: DeactivationParams = None):
         self.model_type = model_type
         self.params = params or DeactivationParams()
+        # Resolve the rate law once instead of string-matching every step
+        self._rate_fn = _RATE_FUNCTIONS.get(model_type, _rate_first)  # Default to first order
     
     def rate(self, activity: float, T: float, C_CH4: float = 0.0) -> float:
         """
@@ -66,17 +101,7 @@ class DeactivationModel:
             da/dt [1/min] (negative value)
         """
         k_d = self.params.get_kd_at_temperature(T)
-        
-        if self.model_type == 'linear':
-            return -k_d
-        elif self.model_type == 'first_order':
-            return -k_d * activity
-        elif self.model_type == 'second_order':
-            return -k_d * activity ** 2
-        elif self.model_type == 'coking':
-            return -k_d * activity * (C_CH4 * 1000)  # Convert to mol/m³
-        else:
-            return -k_d * activity  # Default to first order
+        return self._rate_fn(activity, k_d, C_CH4)
 
 
 # ============================================================================
@@ -248,15 +273,17 @@ class TransientReactor:
         y0 = [self.F_CH4_in, self.F_H2_in, cfg.inlet_pressure]
         
         # Solve ODE
-        solution = solve_ivp(
-            ode_system,
-            (0, cfg.bed_height),
-            y0,
-            method='RK45',
-            dense_output=True,
-            rtol=1e-6,
-            atol=1e-10
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            solution = solve_ivp(
+                ode_system,
+                (0, cfg.bed_height),
+                y0,
+                method='RK45',
+                dense_output=True,
+                rtol=1e-6,
+                atol=1e-10
+            )
         
         # Extract outlet values
         F_CH4_out = max(solution.y[0, -1], 0)
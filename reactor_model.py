@@ -1,6 +1,37 @@
+import functools
+import math
+import warnings
+from collections.abc import Mapping
 import numpy as np
 from scipy.integrate import solve_ivp
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]): return args[0]
+        return lambda fn: fn
+
+# Optional compiled ODE drivers (solver='numbalsoda' / 'cyrk'); scipy is always available
+try:
+    from numba import carray, cfunc
+    from numbalsoda import lsoda, lsoda_sig
+except ImportError:
+    lsoda = None
+try:
+    from CyRK import nbsolve_ivp
+except ImportError:
+    nbsolve_ivp = None
+
+# Failures a compiled driver may raise for a hard solve; anything else is a bug and propagates
+_DRIVER_ERRORS = (RuntimeError, ValueError, ArithmeticError)
+_DRIVER_FALLBACK_WARNED = set()
+
+def _warn_driver_fallback(driver, reason):
+    if driver in _DRIVER_FALLBACK_WARNED: return
+    _DRIVER_FALLBACK_WARNED.add(driver)
+    warnings.warn(f"{driver} driver failed ({reason}); falling back to scipy solve_ivp", RuntimeWarning, stacklevel=4)
 
 # --- PHYSICAL CONSTANTS ---
 R_GAS = 8.314
@@ -10,38 +41,197 @@ MW_C = 12.01e-3
 MW_N2 = 28.01e-3
 
 # --- HELPER FUNCTIONS ---
+@njit(cache=True, fastmath=True)
 def gas_viscosity(T, y_CH4, y_H2, y_N2):
     mu_CH4 = 1.02e-5 * (T / 300) ** 0.87
     mu_H2 = 8.76e-6 * (T / 300) ** 0.68
     mu_N2 = 1.78e-5 * (T / 300) ** 0.67
     return y_CH4 * mu_CH4 + y_H2 * mu_H2 + y_N2 * mu_N2
 
+@njit(cache=True, fastmath=True)
 def gas_density(T, P, y_CH4, y_H2, y_N2):
     MW_mix = y_CH4 * MW_CH4 + y_H2 * MW_H2 + y_N2 * MW_N2
     return P * MW_mix / (R_GAS * T)
 
+@njit(cache=True, fastmath=True)
 def diffusivity_CH4(T, P):
     return 1.87e-5 * (T / 300) ** 1.75 * (101325 / P)
 
+@njit(cache=True, fastmath=True)
 def heat_capacity_mix(T, y_CH4, y_H2, y_N2):
     Cp_CH4 = 35.69 + 0.0275 * T
     Cp_H2 = 28.84 + 0.00192 * T
     Cp_N2 = 29.12 + 0.00293 * T
     return y_CH4 * Cp_CH4 + y_H2 * Cp_H2 + y_N2 * Cp_N2
 
+@njit(cache=True, fastmath=True)
 def arrhenius_rate_constant(T, A, Ea, beta):
     return A * T ** beta * np.exp(-Ea / (R_GAS * T))
 
+@njit(cache=True, fastmath=True)
 def effectiveness_factor(phi):
-    if phi < 0.1: return 1.0
-    elif phi > 100: return 3.0 / phi
-    else: return (3.0 / phi) * (1.0 / np.tanh(phi) - 1.0 / phi)
+    # Exact sphere formula for all phi (it tends to 3/phi by itself); below 1e-3, eta = 1 - phi^2/15 rounds to 1
+    if phi < 1e-3: return 1.0
+    return (3.0 / phi) * (1.0 / math.tanh(phi) - 1.0 / phi)
+
+@njit(cache=True, fastmath=True)
+def effectiveness_factor_derivative(phi):
+    # d(eta)/d(phi); series below 0.1 where the closed form cancels badly
+    if phi < 1e-3: return 0.0
+    if phi < 0.1: return -2.0 * phi / 15.0 + 8.0 * phi**3 / 315.0
+    coth = 1.0 / math.tanh(phi)
+    return 3.0 * (1.0 - coth**2) / phi - 3.0 * coth / phi**2 + 6.0 / phi**3
 
+@njit(cache=True, fastmath=True)
 def ergun_pressure_drop(u, rho, mu, d_p, eps):
     term1 = 150 * mu * (1 - eps)**2 / (d_p**2 * eps**3) * u
     term2 = 1.75 * rho * (1 - eps) / (d_p * eps**3) * u**2
     return term1 + term2
 
+# --- COMPILED ODE RIGHT-HAND SIDE ---
+# Layout of the flat parameter vector packed by MethaneDecompositionReactor.
+# Holds config-derived invariants (Ergun coefficients, d_p/6, ...) so the RHS only does state-dependent work.
+# The P_*_ISO entries are T-only properties evaluated at the inlet temperature: constant down an isothermal bed.
+N_PARAMS = 17
+(P_AREA, P_POR_TAU, P_DP_OVER_6, P_ONE_MINUS_EPS, P_ERGUN_A, P_ERGUN_B,
+ P_A, P_EA_OVER_R, P_BETA, P_DH, P_F_N2, P_ISOTHERMAL,
+ P_MU_CH4_ISO, P_MU_H2_ISO, P_MU_N2_ISO, P_DP_PRODUCT_ISO, P_K_ISO) = range(N_PARAMS)
+
+@njit(cache=True, fastmath=True)
+def ode_rhs_inplace(z, y, p, dy):
+    F_CH4, F_H2, T, P = y[0], y[1], y[2], y[3]
+    A = p[P_AREA]; F_N2 = p[P_F_N2]
+    
+    # Stability Clamps
+    F_CH4 = max(F_CH4, 1e-30); F_H2 = max(F_H2, 0.0); T = max(T, 300.0); P = max(P, 1000.0)
+    
+    F_total = F_CH4 + F_H2 + F_N2
+    y_CH4 = F_CH4 / F_total; y_H2 = F_H2 / F_total; y_N2 = F_N2 / F_total
+    
+    rho = gas_density(T, P, y_CH4, y_H2, y_N2)
+    Q = F_total * 1000 * R_GAS * T / P
+    u = Q / A
+    C_CH4 = F_CH4 / Q
+    if p[P_ISOTHERMAL] > 0:
+        # T is fixed at the inlet value: skip the pow/exp calls
+        mu = y_CH4 * p[P_MU_CH4_ISO] + y_H2 * p[P_MU_H2_ISO] + y_N2 * p[P_MU_N2_ISO]
+        D_eff = p[P_DP_PRODUCT_ISO] / P * p[P_POR_TAU]
+        k = p[P_K_ISO]
+    else:
+        mu = gas_viscosity(T, y_CH4, y_H2, y_N2)
+        D_eff = diffusivity_CH4(T, P) * p[P_POR_TAU]
+        k = p[P_A] * T ** p[P_BETA] * np.exp(-p[P_EA_OVER_R] / T)
+    phi = p[P_DP_OVER_6] * np.sqrt(k / D_eff) if D_eff > 0 else 0.0
+    eta = effectiveness_factor(phi)
+    r_bed = k * eta * C_CH4 * p[P_ONE_MINUS_EPS]
+    
+    dy[0] = -1.0 * r_bed * A
+    dy[1] = +2.0 * r_bed * A
+    
+    if p[P_ISOTHERMAL] > 0: dy[2] = 0.0
+    else:
+        Cp_mix = heat_capacity_mix(T, y_CH4, y_H2, y_N2)
+        Q_rxn = -p[P_DH] * r_bed * A * 1000
+        dy[2] = Q_rxn / (F_total * 1000 * Cp_mix + 1e-10)
+    
+    dy[3] = -(p[P_ERGUN_A] * mu * u + p[P_ERGUN_B] * rho * u * u)
+
+@njit(cache=True, fastmath=True)
+def ode_rhs(z, y, p):
+    # solve_ivp keeps references to returned derivatives, so each call gets a fresh array
+    dy = np.empty(4)
+    ode_rhs_inplace(z, y, p, dy)
+    return dy
+
+@njit(cache=True, fastmath=True)
+def ode_jac(z, y, p):
+    # Analytical Jacobian d(dy/dz)/dy of ode_rhs (4x4); clamped states get zero columns
+    F_CH4, F_H2, T, P = y[0], y[1], y[2], y[3]
+    A = p[P_AREA]; F_N2 = p[P_F_N2]
+    J = np.zeros((4, 4))
+    
+    on_CH4 = F_CH4 > 1e-30; on_H2 = F_H2 > 0.0; on_T = T > 300.0; on_P = P > 1000.0
+    F_CH4 = max(F_CH4, 1e-30); F_H2 = max(F_H2, 0.0); T = max(T, 300.0); P = max(P, 1000.0)
+    F_total = F_CH4 + F_H2 + F_N2
+    
+    # Reaction rate r_bed = k * eta(phi) * C_CH4 * (1 - eps), with C_CH4 = F_CH4 * P / (1000 R T F_total)
+    C_CH4 = F_CH4 * P / (F_total * 1000 * R_GAS * T)
+    iso = p[P_ISOTHERMAL] > 0
+    if iso:
+        # Matches the RHS: k, D and mu are frozen at the inlet temperature
+        D_eff = p[P_DP_PRODUCT_ISO] / P * p[P_POR_TAU]
+        k = p[P_K_ISO]
+        dlnk_dT = 0.0; dlnD_dT = 0.0
+    else:
+        D_eff = diffusivity_CH4(T, P) * p[P_POR_TAU]
+        k = p[P_A] * T ** p[P_BETA] * np.exp(-p[P_EA_OVER_R] / T)
+        dlnk_dT = p[P_BETA] / T + p[P_EA_OVER_R] / T**2; dlnD_dT = 1.75 / T
+    phi = p[P_DP_OVER_6] * np.sqrt(k / D_eff) if D_eff > 0 else 0.0
+    eta = effectiveness_factor(phi)
+    dlneta_dphi = effectiveness_factor_derivative(phi) / eta
+    r_bed = k * eta * C_CH4 * p[P_ONE_MINUS_EPS]
+    
+    dr = np.zeros(4)
+    dr[0] = r_bed * (1.0 / F_CH4 - 1.0 / F_total) if on_CH4 else 0.0
+    dr[1] = -r_bed / F_total if on_H2 else 0.0
+    # phi ~ sqrt(k / D_eff) with D_eff ~ T^1.75 / P
+    dr[2] = r_bed * (dlnk_dT + dlneta_dphi * 0.5 * phi * (dlnk_dT - dlnD_dT) - 1.0 / T) if on_T else 0.0
+    dr[3] = r_bed * (dlneta_dphi * 0.5 * phi / P + 1.0 / P) if on_P else 0.0
+    
+    for j in range(4):
+        J[0, j] = -dr[j] * A
+        J[1, j] = 2.0 * dr[j] * A
+    
+    if not iso:
+        # dT/dz = N r_bed / S with S = 1000 sum(F_i Cp_i(T)) + 1e-10
+        N = -p[P_DH] * A * 1000
+        Cp_CH4 = 35.69 + 0.0275 * T; Cp_H2 = 28.84 + 0.00192 * T; Cp_N2 = 29.12 + 0.00293 * T
+        S = 1000 * (F_CH4 * Cp_CH4 + F_H2 * Cp_H2 + F_N2 * Cp_N2) + 1e-10
+        dS = np.zeros(4)
+        dS[0] = 1000 * Cp_CH4 if on_CH4 else 0.0
+        dS[1] = 1000 * Cp_H2 if on_H2 else 0.0
+        dS[2] = 1000 * (F_CH4 * 0.0275 + F_H2 * 0.00192 + F_N2 * 0.00293) if on_T else 0.0
+        for j in range(4):
+            J[2, j] = N * (dr[j] * S - r_bed * dS[j]) / S**2
+    
+    # Ergun: dP/dz = -(c1 mu u + c2 G u), where mu u = 1000 R T sum(F_i mu_i) / (P A),
+    # u = 1000 R T F_total / (P A) and the mass flux G = rho u = 1000 sum(F_i MW_i) / A
+    c1 = p[P_ERGUN_A]; c2 = p[P_ERGUN_B]
+    if iso: mu_CH4 = p[P_MU_CH4_ISO]; mu_H2 = p[P_MU_H2_ISO]; mu_N2 = p[P_MU_N2_ISO]
+    else: mu_CH4 = 1.02e-5 * (T / 300) ** 0.87; mu_H2 = 8.76e-6 * (T / 300) ** 0.68; mu_N2 = 1.78e-5 * (T / 300) ** 0.67
+    F_mu = F_CH4 * mu_CH4 + F_H2 * mu_H2 + F_N2 * mu_N2
+    G = 1000 * (F_CH4 * MW_CH4 + F_H2 * MW_H2 + F_N2 * MW_N2) / A
+    u_per_F = 1000 * R_GAS * T / (P * A)
+    u = u_per_F * F_total
+    dP_dz = -(c1 * u_per_F * F_mu + c2 * G * u)
+    if on_CH4: J[3, 0] = -(c1 * u_per_F * mu_CH4 + c2 * (1000 * MW_CH4 / A * u + G * u_per_F))
+    if on_H2: J[3, 1] = -(c1 * u_per_F * mu_H2 + c2 * (1000 * MW_H2 / A * u + G * u_per_F))
+    if on_T:
+        F_mu_n = 0.0 if iso else 0.87 * F_CH4 * mu_CH4 + 0.68 * F_H2 * mu_H2 + 0.67 * F_N2 * mu_N2
+        J[3, 2] = -(c1 * u_per_F * (F_mu + F_mu_n) + c2 * G * u) / T
+    if on_P: J[3, 3] = -dP_dz / P
+    return J
+
+# LSODA callback is compiled once per process and shared by all reactor instances
+_LSODA_FUNCPTR = None
+
+def lsoda_funcptr():
+    global _LSODA_FUNCPTR
+    if _LSODA_FUNCPTR is None:
+        @cfunc(lsoda_sig)
+        def rhs(t, y, dy, p):
+            ode_rhs_inplace(t, carray(y, (4,)), carray(p, (N_PARAMS,)), carray(dy, (4,)))
+        _LSODA_FUNCPTR = rhs.address
+    return _LSODA_FUNCPTR
+
+# --- SOLVER TOLERANCES ---
+# 'screening' for optimizer/sensitivity sweeps, 'refinement' (solve() defaults) for final results.
+# atol stays tiny: molar flows are ~1e-9..1e-8 kmol/s, so a looser atol would swamp them.
+SOLVER_TOLERANCES = {
+    'screening': {'method': 'LSODA', 'rtol': 1e-5, 'atol': 1e-12},
+    'refinement': {'method': 'RK45', 'rtol': 1e-8, 'atol': 1e-12},
+}
+
 # --- CONFIG CLASS ---
 @dataclass
 class ReactorConfig:
@@ -55,71 +245,247 @@ class ReactorConfig:
     def cross_section_area(self) -> float:
         return np.pi * (self.diameter / 2) ** 2
 
+# --- FEASIBILITY PRESCREEN ---
+# Cheap inlet-only bounds for isothermal beds, used to reject trials without an ODE solve.
+def prescreen_pressure_drop(cfg: ReactorConfig) -> float:
+    # Lower bound on the bed pressure drop [Pa]. Along the bed P falls and CH4 -> 2H2 adds moles, so u only
+    # grows and sum(F_i mu_i) grows (2 mu_H2 > mu_CH4); the mass flux G = rho u can only fall by the carbon
+    # deposited, so the inlet Ergun gradient with G taken at full CH4 conversion never exceeds the local one.
+    T, P = cfg.inlet_temperature, cfg.inlet_pressure
+    MW_in = cfg.y_CH4_in * MW_CH4 + cfg.y_H2_in * MW_H2 + cfg.y_N2_in * MW_N2
+    rho = gas_density(T, P, cfg.y_CH4_in, cfg.y_H2_in, cfg.y_N2_in) * (1 - cfg.y_CH4_in * MW_C / MW_in)
+    mu = gas_viscosity(T, cfg.y_CH4_in, cfg.y_H2_in, cfg.y_N2_in)
+    u = cfg.flow_rate / cfg.cross_section_area
+    return ergun_pressure_drop(u, rho, mu, cfg.particle_diameter, cfg.bed_porosity) * cfg.bed_height
+
+def prescreen_max_conversion(cfg: ReactorConfig) -> float:
+    # Upper bound on CH4 conversion [-]: with eta <= 1 and Q >= Q_in everywhere, the first-order PFR
+    # at the inlet volumetric flow (longest residence time) converts at least as much as the bed.
+    k = arrhenius_rate_constant(cfg.inlet_temperature, cfg.pre_exponential, cfg.activation_energy, cfg.beta)
+    return 1.0 - math.exp(-k * (1 - cfg.bed_porosity) * cfg.cross_section_area * cfg.bed_height / cfg.flow_rate)
+
+# --- PROFILE RESULT ---
+class ReactorProfile(Mapping):
+    """Read-only mapping of axial profiles; derived fields are computed on first access."""
+    FIELDS = ('z', 'F_CH4', 'F_H2', 'T', 'P', 'y_CH4', 'y_H2', 'y_N2', 'X_CH4',
+              'm_dot_C_kg_s', 'm_dot_H2_kg_s', 'V_dot_H2_Nm3_h')
+    
+    def __init__(self, z, Y, F_CH4_in, F_N2_in):
+        # Clip the flow rows in place - the solver output is not reused
+        np.clip(Y[0], 0, None, out=Y[0]); np.clip(Y[1], 0, None, out=Y[1])
+        self.F_CH4_in = F_CH4_in; self.F_N2_in = F_N2_in
+        self._F_total = None
+        self._data = {'z': z, 'F_CH4': Y[0], 'F_H2': Y[1], 'T': Y[2], 'P': Y[3]}
+    
+    def __getitem__(self, key):
+        if key not in self._data:
+            if key not in self.FIELDS: raise KeyError(key)
+            self._data[key] = getattr(self, '_' + key)()
+        return self._data[key]
+    
+    def __iter__(self): return iter(self.FIELDS)
+    def __len__(self): return len(self.FIELDS)
+    def __repr__(self): return f"ReactorProfile(n_points={len(self._data['z'])})"
+    
+    @property
+    def F_total(self):
+        if self._F_total is None:
+            self._F_total = np.add(self._data['F_CH4'], self._data['F_H2'])
+            self._F_total += self.F_N2_in
+        return self._F_total
+    
+    def _y_CH4(self): return np.divide(self._data['F_CH4'], self.F_total)
+    def _y_H2(self): return np.divide(self._data['F_H2'], self.F_total)
+    def _y_N2(self): return np.divide(self.F_N2_in, self.F_total)
+    
+    def _X_CH4(self):
+        X = np.subtract(self.F_CH4_in, self._data['F_CH4']); X /= self.F_CH4_in
+        return np.clip(X, 0, 1, out=X)
+    
+    def _m_dot_C_kg_s(self):
+        m = np.subtract(self.F_CH4_in, self._data['F_CH4']); m *= MW_C * 1000
+        return m
+    
+    def _m_dot_H2_kg_s(self): return self._data['F_H2'] * (MW_H2 * 1000)
+    def _V_dot_H2_Nm3_h(self): return self._data['F_H2'] * (1000 * R_GAS * 273.15 / 101325 * 3600)
+
 # --- SOLVER CLASS ---
 class MethaneDecompositionReactor:
-    def __init__(self, config: ReactorConfig, isothermal: bool = True):
+    def __init__(self, config: ReactorConfig, isothermal: bool = True, solver: str = 'scipy'):
         self.cfg = config
         self.isothermal = isothermal
+        # 'numbalsoda' / 'cyrk' need the optional package; otherwise fall back to scipy
+        available = {'scipy': True, 'numbalsoda': lsoda is not None, 'cyrk': nbsolve_ivp is not None}
+        if solver not in available: raise ValueError(f"Unknown solver '{solver}'")
+        self.solver = solver if available[solver] else 'scipy'
         
         C_total_in = config.inlet_pressure / (R_GAS * config.inlet_temperature) / 1000
         self.F_total_in = config.flow_rate * C_total_in
         self.F_CH4_in = config.y_CH4_in * self.F_total_in
         self.F_H2_in = config.y_H2_in * self.F_total_in
         self.F_N2_in = config.y_N2_in * self.F_total_in
+        
+        # Config packed into a flat float64 vector for the compiled RHS (see P_* indices)
+        d_p, eps = config.particle_diameter, config.bed_porosity
+        T_in = max(config.inlet_temperature, 300.0)  # Same clamp as the RHS
+        self.params = np.array([
+            config.cross_section_area,
+            config.particle_porosity / config.tortuosity,
+            d_p / 6,
+            1 - eps,
+            150 * (1 - eps)**2 / (d_p**2 * eps**3),     # Ergun viscous coefficient
+            1.75 * (1 - eps) / (d_p * eps**3),          # Ergun inertial coefficient
+            config.pre_exponential,
+            config.activation_energy / R_GAS,
+            config.beta,
+            config.heat_of_reaction,
+            self.F_N2_in,
+            float(isothermal),
+            gas_viscosity(T_in, 1.0, 0.0, 0.0),     # Pure-component viscosities
+            gas_viscosity(T_in, 0.0, 1.0, 0.0),
+            gas_viscosity(T_in, 0.0, 0.0, 1.0),
+            diffusivity_CH4(T_in, 1.0),             # D_CH4 * P
+            arrhenius_rate_constant(T_in, config.pre_exponential, config.activation_energy, config.beta)
+        ], dtype=np.float64)
     
     def _ode_system(self, z, y):
-        F_CH4, F_H2, T, P = y
-        cfg = self.cfg
-        
-        # Stability Clamps
-        F_CH4 = max(F_CH4, 1e-30); F_H2 = max(F_H2, 0.0); T = max(T, 300.0); P = max(P, 1000.0)
-        
-        F_total = F_CH4 + F_H2 + self.F_N2_in
-        y_CH4 = F_CH4 / F_total; y_H2 = F_H2 / F_total; y_N2 = self.F_N2_in / F_total
-        
-        rho = gas_density(T, P, y_CH4, y_H2, y_N2)
-        mu = gas_viscosity(T, y_CH4, y_H2, y_N2)
-        Q = F_total * 1000 * R_GAS * T / P
-        u = Q / cfg.cross_section_area
-        C_CH4 = F_CH4 / Q
-        D_mol = diffusivity_CH4(T, P)
-        D_eff = D_mol * cfg.particle_porosity / cfg.tortuosity
-        k = arrhenius_rate_constant(T, cfg.pre_exponential, cfg.activation_energy, cfg.beta)
-        phi = (cfg.particle_diameter / 6) * np.sqrt(k / D_eff) if D_eff > 0 else 0
-        eta = effectiveness_factor(phi)
-        r_bed = k * eta * C_CH4 * (1 - cfg.bed_porosity)
-        A = cfg.cross_section_area
-        
-        dF_CH4_dz = -1.0 * r_bed * A
-        dF_H2_dz = +2.0 * r_bed * A
-        
-        if self.isothermal: dT_dz = 0.0
-        else:
-            Cp_mix = heat_capacity_mix(T, y_CH4, y_H2, y_N2)
-            F_total_mol = F_total * 1000
-            Q_rxn = -cfg.heat_of_reaction * r_bed * A * 1000
-            dT_dz = Q_rxn / (F_total_mol * Cp_mix + 1e-10)
-            
-        dP_dz = -ergun_pressure_drop(u, rho, mu, cfg.particle_diameter, cfg.bed_porosity)
-        return np.array([dF_CH4_dz, dF_H2_dz, dT_dz, dP_dz])
+        return ode_rhs(z, y, self.params)
+    
+    def _jacobian(self, z, y):
+        return ode_jac(z, y, self.params)
         
-    def solve(self, n_points=200):
-        y0 = np.array([self.F_CH4_in, self.F_H2_in, self.cfg.inlet_temperature, self.cfg.inlet_pressure])
+    def _integrate(self, y0, z_eval, method, rtol, atol, first_step):
+        L = self.cfg.bed_height
+        # Compiled drivers use their own method (LSODA / RK45) with the requested tolerances.
+        # An unsuccessful solve or an expected solver error falls through to scipy.
+        try:
+            if self.solver == 'numbalsoda':
+                z_out = np.array([0.0, L]) if z_eval is None else z_eval
+                usol, success = lsoda(lsoda_funcptr(), y0, z_out, data=self.params, rtol=rtol, atol=atol)
+                if success: return z_out, usol.T
+                _warn_driver_fallback(self.solver, "unsuccessful solve")
+            elif self.solver == 'cyrk':
+                # nbsolve_ivp wants an array; empty = solver steps only (terminal solves)
+                t_eval = np.empty(0) if z_eval is None else z_eval
+                sol = nbsolve_ivp(ode_rhs, (0, L), y0, args=(self.params,), rk_method=1, t_eval=t_eval, rtol=rtol, atol=atol)
+                if sol.success: return sol.t, sol.y
+                _warn_driver_fallback(self.solver, f"unsuccessful solve: {sol.message}")
+        except _DRIVER_ERRORS as e:
+            _warn_driver_fallback(self.solver, f"{type(e).__name__}: {e}")
+        # scipy (default, and fallback if a compiled driver fails)
+        # Implicit methods use the analytical Jacobian instead of finite differences
+        options = {'jac': ode_jac} if method in ('LSODA', 'BDF', 'Radau') else {}
         solution = solve_ivp(
-            self._ode_system, (0, self.cfg.bed_height), y0, 
-            method='RK45', t_eval=np.linspace(0, self.cfg.bed_height, n_points),
-            rtol=1e-8, atol=1e-12
+            ode_rhs, (0, L), y0, args=(self.params,),
+            method=method, t_eval=z_eval,
+            rtol=rtol, atol=atol, first_step=first_step, **options
         )
-        z = solution.t
-        F_CH4 = np.maximum(solution.y[0], 0); F_H2 = np.maximum(solution.y[1], 0)
-        T = solution.y[2]; P = solution.y[3]
-        F_total = F_CH4 + F_H2 + self.F_N2_in
-        F_C = self.F_CH4_in - F_CH4
+        return solution.t, solution.y
         
+    def _y0(self):
+        return np.array([self.F_CH4_in, self.F_H2_in, self.cfg.inlet_temperature, self.cfg.inlet_pressure])
+        
+    def solve_profile(self, n_points=200, method='RK45', rtol=1e-8, atol=1e-12, first_step=None):
+        # first_step=None lets solve_ivp choose; a fixed first step can stall LSODA on stiff non-isothermal runs
+        z, Y = self._integrate(self._y0(), np.linspace(0, self.cfg.bed_height, n_points), method, rtol, atol, first_step)
+        return self._postprocess(z, Y)
+    
+    solve = solve_profile
+    
+    def solve_terminal(self, method='RK45', rtol=1e-8, atol=1e-12, first_step=None, use_cache=True):
+        # Outlet values only (no dense output) - for optimizer/sensitivity trials.
+        # Cached on the config rounded to 6 significant figures (solved at the rounded config).
+        if use_cache:
+            key = tuple(float(f'{x:.6g}') for x in astuple(self.cfg))
+            return dict(_solve_terminal_cached(key, self.isothermal, self.solver, method, rtol, atol, first_step))
+        z, Y = self._integrate(self._y0(), None, method, rtol, atol, first_step)
+        return self._terminal(Y[:, -1])
+    
+    def _terminal(self, y_out):
+        F_CH4 = max(y_out[0], 0.0); F_H2 = max(y_out[1], 0.0); T = y_out[2]; P = y_out[3]
         return {
-            'z': z, 'F_CH4': F_CH4, 'F_H2': F_H2, 'T': T, 'P': P,
-            'y_CH4': F_CH4/F_total, 'y_H2': F_H2/F_total, 'y_N2': self.F_N2_in/F_total,
-            'X_CH4': np.clip((self.F_CH4_in - F_CH4) / self.F_CH4_in, 0, 1),
-            'm_dot_C_kg_s': F_C * MW_C * 1000, 'm_dot_H2_kg_s': F_H2 * MW_H2 * 1000,
-            'V_dot_H2_Nm3_h': F_H2 * 1000 * R_GAS * 273.15 / 101325 * 3600
-        }
\ No newline at end of file
+            'F_CH4': F_CH4, 'F_H2': F_H2, 'T': T, 'P': P,
+            'X_CH4': min(max((self.F_CH4_in - F_CH4) / self.F_CH4_in, 0.0), 1.0),
+            'V_dot_H2_Nm3_h': F_H2 * 1000 * R_GAS * 273.15 / 101325 * 3600,
+            'pressure_drop': self.cfg.inlet_pressure - P
+        }
+    
+    def _postprocess(self, z, Y):
+        return ReactorProfile(z, Y, self.F_CH4_in, self.F_N2_in)
+
+# --- TERMINAL SOLVE CACHE ---
+# Bounded LRU shared by all reactors in the process; clear_cache() releases it (e.g. between sessions)
+@functools.lru_cache(maxsize=4096)
+def _solve_terminal_cached(cfg_key, isothermal, solver, method, rtol, atol, first_step):
+    reactor = MethaneDecompositionReactor(ReactorConfig(*cfg_key), isothermal, solver)
+    return reactor.solve_terminal(method, rtol, atol, first_step, use_cache=False)
+
+def clear_cache():
+    _solve_terminal_cached.cache_clear()
+
+# --- BATCHED SOLVER ---
+def batched_ode_rhs(xi, y, p, L):
+    # NumPy-broadcast RHS for k reactors at once. State is (4, k[, m]) flattened C-order;
+    # xi = z / L is the normalized bed coordinate so reactors of different length share one span.
+    k = L.shape[0]
+    Y = y.reshape(4, k, -1)
+    p = p[:, :, None]; L = L[:, None]
+    A = p[P_AREA]; F_N2 = p[P_F_N2]
+    
+    # Stability Clamps
+    F_CH4 = np.maximum(Y[0], 1e-30); F_H2 = np.maximum(Y[1], 0.0); T = np.maximum(Y[2], 300.0); P = np.maximum(Y[3], 1000.0)
+    
+    F_total = F_CH4 + F_H2 + F_N2
+    y_CH4 = F_CH4 / F_total; y_H2 = F_H2 / F_total; y_N2 = F_N2 / F_total
+    
+    rho = P * (y_CH4 * MW_CH4 + y_H2 * MW_H2 + y_N2 * MW_N2) / (R_GAS * T)
+    mu = (y_CH4 * 1.02e-5 * (T / 300) ** 0.87 + y_H2 * 8.76e-6 * (T / 300) ** 0.68
+          + y_N2 * 1.78e-5 * (T / 300) ** 0.67)
+    Q = F_total * 1000 * R_GAS * T / P
+    u = Q / A
+    C_CH4 = F_CH4 / Q
+    D_eff = 1.87e-5 * (T / 300) ** 1.75 * (101325 / P) * p[P_POR_TAU]
+    k_rxn = p[P_A] * T ** p[P_BETA] * np.exp(-p[P_EA_OVER_R] / T)
+    phi = p[P_DP_OVER_6] * np.sqrt(k_rxn / D_eff)
+    phi_safe = np.maximum(phi, 1e-3)
+    eta = np.where(phi < 1e-3, 1.0, (3.0 / phi_safe) * (1.0 / np.tanh(phi_safe) - 1.0 / phi_safe))
+    r_bed = k_rxn * eta * C_CH4 * p[P_ONE_MINUS_EPS]
+    
+    dY = np.empty_like(Y)
+    dY[0] = -1.0 * r_bed * A
+    dY[1] = +2.0 * r_bed * A
+    Cp_mix = (y_CH4 * (35.69 + 0.0275 * T) + y_H2 * (28.84 + 0.00192 * T) + y_N2 * (29.12 + 0.00293 * T))
+    dY[2] = np.where(p[P_ISOTHERMAL] > 0, 0.0, -p[P_DH] * r_bed * A * 1000 / (F_total * 1000 * Cp_mix + 1e-10))
+    dY[3] = -(p[P_ERGUN_A] * mu * u + p[P_ERGUN_B] * rho * u * u)
+    
+    dY *= L  # d/dxi = L * d/dz
+    return dY.reshape(y.shape)
+
+class BatchedMethaneDecompositionReactor:
+    """Solves k independent reactors as one vectorized ODE system (e.g. a sensitivity sweep)."""
+    def __init__(self, configs, isothermal: bool = True):
+        self.reactors = [MethaneDecompositionReactor(cfg, isothermal) for cfg in configs]
+        # Struct-of-arrays: one column per reactor
+        self.params = np.stack([r.params for r in self.reactors], axis=1)
+        self.L = np.array([r.cfg.bed_height for r in self.reactors])
+        self.y0 = np.array([[r.F_CH4_in, r.F_H2_in, r.cfg.inlet_temperature, r.cfg.inlet_pressure]
+                            for r in self.reactors]).T
+    
+    def _integrate(self, xi_eval, method, rtol, atol, first_step):
+        solution = solve_ivp(
+            batched_ode_rhs, (0, 1), self.y0.ravel(), args=(self.params, self.L),
+            method=method, t_eval=xi_eval, vectorized=True,
+            rtol=rtol, atol=atol, first_step=first_step
+        )
+        if not solution.success: raise RuntimeError(solution.message)
+        return solution.t, solution.y.reshape(4, len(self.reactors), -1)
+    
+    def solve_profile(self, n_points=200, method='RK45', rtol=1e-8, atol=1e-12, first_step=None):
+        xi, Y = self._integrate(np.linspace(0, 1, n_points), method, rtol, atol, first_step)
+        return [r._postprocess(xi * r.cfg.bed_height, Y[:, i]) for i, r in enumerate(self.reactors)]
+    
+    solve = solve_profile
+    
+    def solve_terminal(self, method='RK45', rtol=1e-8, atol=1e-12, first_step=None):
+        xi, Y = self._integrate(None, method, rtol, atol, first_step)
+        return [r._terminal(Y[:, i, -1]) for i, r in enumerate(self.reactors)]
@@ -4,15 +4,6 @@ Anukaran AI - Utilities Module
 Contains plotting and helper functions.
 """
 
-from .plotting import (
-    create_convergence_plot,
-    create_parameter_importance_plot,
-    create_optimization_history_plot,
-    create_contour_plot,
-    create_trials_table_data,
-    create_summary_stats
-)
-
 __all__ = [
     'create_convergence_plot',
     'create_parameter_importance_plot',
@@ -20,4 +11,13 @@ __all__ = [
     'create_contour_plot',
     'create_trials_table_data',
     'create_summary_stats'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Plotting pulls in matplotlib; import it on first use so headless
+    # optimizer workers that only touch utils never pay for it (PEP 562)
+    if name in __all__:
+        from . import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,9 +5,22 @@ Shared plotting functions for optimization results.
 Pure Python/Matplotlib - No Streamlit imports.
 """
 
+import sys
 import numpy as np
+import matplotlib
+
+# Headless backend skips GUI probing; leave it alone if the host app already set up pyplot
+if 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    from core.optimizer import TrialHistory
+
+# Trials as the optimizer's columnar TrialHistory or a list of {'params', 'value'} dicts
+Trials = Union["TrialHistory", List[Dict]]
 
 
 def create_convergence_plot(convergence_history: List[float], best_history: List[float] = None):
@@ -23,18 +36,15 @@ def create_convergence_plot(convergence_history: List[float], best_history: List
     """
     fig, ax = plt.subplots(figsize=(8, 4))
     
-    iterations = range(1, len(convergence_history) + 1)
+    convergence_history = np.asarray(convergence_history, dtype=np.float64)
+    iterations = np.arange(1, len(convergence_history) + 1)
     
     # Plot all evaluations
     ax.scatter(iterations, convergence_history, alpha=0.5, s=30, c='blue', label='Each Trial')
     
     # Plot best-so-far line
     if best_history is None:
-        best_history = []
-        current_best = float('-inf')
-        for val in convergence_history:
-            current_best = max(current_best, val)
-            best_history.append(current_best)
+        best_history = np.maximum.accumulate(convergence_history)
     
     ax.plot(iterations, best_history, 'r-', linewidth=2, label='Best So Far')
     
@@ -84,12 +94,12 @@ def create_parameter_importance_plot(importance_scores: Dict[str, float]):
     return fig
 
 
-def create_optimization_history_plot(trials: List[Dict], objective_name: str = "Objective"):
+def create_optimization_history_plot(trials: Trials, objective_name: str = "Objective"):
     """
     Create detailed optimization history plot with parameters.
     
     Args:
-        trials: List of trial dictionaries with 'params' and 'value' keys
+        trials: TrialHistory, or list of trial dictionaries with 'params' and 'value' keys
         objective_name: Name of objective for labeling
     
     Returns:
@@ -98,15 +108,9 @@ def create_optimization_history_plot(trials: List[Dict], objective_name: str = "
     fig, axes = plt.subplots(1, 2, figsize=(12, 4))
     
     # Left plot: Objective over iterations
-    iterations = range(1, len(trials) + 1)
-    values = [t['value'] for t in trials]
-    
-    # Calculate best-so-far
-    best_so_far = []
-    current_best = float('-inf')
-    for val in values:
-        current_best = max(current_best, val)
-        best_so_far.append(current_best)
+    iterations = np.arange(1, len(trials) + 1)
+    values = _trial_values(trials)
+    best_so_far = np.maximum.accumulate(values)
     
     axes[0].scatter(iterations, values, alpha=0.6, s=40, c='steelblue', label='Trials')
     axes[0].plot(iterations, best_so_far, 'r-', linewidth=2, label='Best')
@@ -117,15 +121,12 @@ def create_optimization_history_plot(trials: List[Dict], objective_name: str = "
     axes[0].grid(True, alpha=0.3)
     
     # Right plot: Best value highlight
-    best_idx = np.argmax(values)
+    best_idx = int(values.argmax())
     best_trial = trials[best_idx]
     
     param_names = list(best_trial['params'].keys())
     param_values = list(best_trial['params'].values())
     
-    # Normalize for visualization
-    colors = ['#2ecc71' if i == best_idx else '#3498db' for i in range(len(values))]
-    
     axes[1].bar(param_names, param_values, color='#3498db', edgecolor='black')
     axes[1].set_ylabel('Parameter Value')
     axes[1].set_title(f'Best Parameters (Trial #{best_idx + 1})')
@@ -157,14 +158,23 @@ def create_contour_plot(
     Returns:
         matplotlib Figure
     """
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig, ax = plt.subplots(figsize=(8, 6), constrained_layout=True)
     
-    X, Y = np.meshgrid(x_values, y_values)
+    x = np.asarray(x_values, dtype=float)
+    y = np.asarray(y_values, dtype=float)
     
-    contour = ax.contourf(X, Y, z_values, levels=20, cmap='viridis')
-    ax.contour(X, Y, z_values, levels=10, colors='white', linewidths=0.5, alpha=0.5)
+    if _is_uniform(x) and _is_uniform(y):
+        # Regular sweep grid: raster the surface directly, no triangulation.
+        # Pad by half a step so pixel centres sit on the sample coordinates.
+        dx, dy = x[1] - x[0], y[1] - y[0]
+        extent = (x[0] - dx / 2, x[-1] + dx / 2, y[0] - dy / 2, y[-1] + dy / 2)
+        surface = ax.imshow(z_values, origin='lower', extent=extent,
+                            aspect='auto', cmap='viridis', interpolation='bilinear')
+    else:
+        surface = ax.contourf(x, y, z_values, levels=20, cmap='viridis')
+    ax.contour(x, y, z_values, levels=10, colors='white', linewidths=0.5, alpha=0.5)
     
-    cbar = plt.colorbar(contour, ax=ax, label=z_label)
+    cbar = plt.colorbar(surface, ax=ax, label=z_label)
     
     if best_point:
         ax.scatter(best_point[0], best_point[1], c='red', s=200, marker='*',
@@ -175,16 +185,41 @@ def create_contour_plot(
     ax.set_ylabel(y_label, fontsize=11)
     ax.set_title(f'{z_label} Response Surface', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
     return fig
 
 
-def create_trials_table_data(trials: List[Dict], variable_names: List[str]) -> List[Dict]:
+def _is_uniform(values: np.ndarray) -> bool:
+    """True for evenly spaced 1D coordinates (at least two points)"""
+    return len(values) > 1 and np.allclose(np.diff(values), values[1] - values[0])
+
+
+def _trial_values(trials: Trials) -> np.ndarray:
+    """Objective values of all trials as a float64 array"""
+    values = getattr(trials, 'values', None)
+    if isinstance(values, np.ndarray):
+        return values
+    return np.fromiter((t['value'] for t in trials), dtype=np.float64, count=len(trials))
+
+
+def _trial_param_columns(trials: Trials, variable_names: List[str]) -> Dict[str, np.ndarray]:
+    """Parameter columns for the requested names that the trials contain"""
+    params = getattr(trials, 'params', None)
+    if isinstance(params, np.ndarray):
+        index = {name: j for j, name in enumerate(trials.param_names)}
+        return {name: params[:, index[name]] for name in variable_names if name in index}
+    present = set().union(*(t['params'] for t in trials)) if trials else set()
+    return {
+        name: np.array([t['params'].get(name, np.nan) for t in trials], dtype=np.float64)
+        for name in variable_names if name in present
+    }
+
+
+def create_trials_table_data(trials: Trials, variable_names: List[str]) -> List[Dict]:
     """
     Format trials data for display in a table.
     
     Args:
-        trials: List of trial dictionaries
+        trials: TrialHistory, or list of trial dictionaries
         variable_names: List of parameter names
     
     Returns:
@@ -192,31 +227,33 @@ def create_trials_table_data(trials: List[Dict], variable_names: List[str]) -> L
     """
     table_data = []
     
-    best_value = max(t['value'] for t in trials) if trials else 0
+    values = _trial_values(trials)
+    best_idx = int(values.argmax()) if len(values) else -1
+    columns = _trial_param_columns(trials, variable_names)
     
-    for i, trial in enumerate(trials):
+    for i in range(len(values)):
         row = {
             '#': i + 1,
-            'Objective': f"{trial['value']:.6f}",
-            'Best?': '⭐' if trial['value'] == best_value else ''
+            'Objective': f"{values[i]:.6f}",
+            'Best?': '⭐' if i == best_idx else ''
         }
         
-        # Add parameters
-        for var_name in variable_names:
-            if var_name in trial['params']:
-                row[var_name] = f"{trial['params'][var_name]:.2f}"
+        # Add parameters (skipping ones this trial did not set)
+        for var_name, column in columns.items():
+            if not np.isnan(column[i]):
+                row[var_name] = f"{column[i]:.2f}"
         
         table_data.append(row)
     
     return table_data
 
 
-def create_summary_stats(trials: List[Dict]) -> Dict:
+def create_summary_stats(trials: Trials) -> Dict:
     """
     Calculate summary statistics from optimization trials.
     
     Args:
-        trials: List of trial dictionaries
+        trials: TrialHistory, or list of trial dictionaries
     
     Returns:
         Dictionary of summary statistics
@@ -224,18 +261,19 @@ def create_summary_stats(trials: List[Dict]) -> Dict:
     if not trials:
         return {}
     
-    values = [t['value'] for t in trials]
+    values = _trial_values(trials)
     
-    best_idx = np.argmax(values)
+    best_idx = int(values.argmax())
+    best_value = values[best_idx]
     best_trial = trials[best_idx]
     
     return {
         'total_trials': len(trials),
-        'best_value': max(values),
-        'worst_value': min(values),
-        'mean_value': np.mean(values),
-        'std_value': np.std(values),
+        'best_value': best_value,
+        'worst_value': values.min(),
+        'mean_value': values.mean(),
+        'std_value': values.std(),
         'best_trial_number': best_idx + 1,
         'best_params': best_trial['params'],
-        'improvement': ((max(values) - values[0]) / abs(values[0]) * 100) if values[0] != 0 else 0
-    }
\ No newline at end of file
+        'improvement': ((best_value - values[0]) / abs(values[0]) * 100) if values[0] != 0 else 0
+    }